@@ -18,6 +18,7 @@ from ..models.service_patterns import ServicePattern, ServicePatternSet, Service
 
 # Import data path resolver
 from ..utils.data_path_resolver import get_data_directory, get_lines_directory, get_data_file_path
+from ..utils.geo import haversine_leg_distances_km
 
 logger = logging.getLogger(__name__)
 
@@ -145,6 +146,14 @@ class StationDatabaseManager:
     def _add_legacy_connections(self, network: Dict, railway_line, line_name: str):
         """Add connections for lines without service patterns (legacy method)."""
         stations = railway_line.stations
+        coords = [station.coordinates for station in stations]
+        
+        # Measure the whole line in one batch when every station has usable
+        # coordinates; otherwise keep the guarded pairwise calculation
+        if all(c and c.get("lat") and c.get("lng") for c in coords):
+            distances = haversine_leg_distances_km(coords)
+        else:
+            distances = [self.calculate_haversine_distance(a, b) for a, b in zip(coords, coords[1:])]
         
         # Connect adjacent stations on the same line
         for i in range(len(stations) - 1):
@@ -152,9 +161,7 @@ class StationDatabaseManager:
             next_station = stations[i + 1]
             
             # Calculate distance and time
-            distance = self.calculate_haversine_distance(
-                current_station.coordinates, next_station.coordinates
-            )
+            distance = distances[i]
             
             journey_time = self.get_journey_time_between_stations(
                 current_station.name, next_station.name
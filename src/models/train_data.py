@@ -5,9 +5,11 @@ This module defines the core data structures for representing train information,
 including departure times, status, delays, and service details.
 """
 
+import sys
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Dict, Optional, List
 from enum import Enum
 
 
@@ -20,6 +22,23 @@ class TrainStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# Dark theme colors
+_DARK_STATUS_COLORS = {
+    TrainStatus.ON_TIME: "#4caf50",  # Green
+    TrainStatus.DELAYED: "#ff9800",  # Orange
+    TrainStatus.CANCELLED: "#f44336",  # Red
+    TrainStatus.UNKNOWN: "#666666",  # Gray
+}
+
+# Light theme colors
+_LIGHT_STATUS_COLORS = {
+    TrainStatus.ON_TIME: "#388e3c",  # Darker green
+    TrainStatus.DELAYED: "#f57c00",  # Darker orange
+    TrainStatus.CANCELLED: "#d32f2f",  # Darker red
+    TrainStatus.UNKNOWN: "#9e9e9e",  # Darker gray
+}
+
+
 class ServiceType(Enum):
     """Enumeration of train service types."""
 
@@ -43,6 +62,12 @@ class CallingPoint:
     is_origin: bool = False
     is_destination: bool = False
 
+    def __post_init__(self) -> None:
+        # Station names repeat across trains and refreshes; interning them on
+        # ingest makes the UI's equality checks and set/dict lookups cheap.
+        if type(self.station_name) is str:
+            object.__setattr__(self, "station_name", sys.intern(self.station_name))
+
     def format_arrival_time(self) -> str:
         """Format arrival time for display."""
         time_to_show = self.expected_arrival or self.scheduled_arrival
@@ -107,31 +132,23 @@ class TrainData:
     @property
     def status_color(self) -> str:
         """Get color code for status display based on current theme."""
-        # Dark theme colors
-        dark_color_map = {
-            TrainStatus.ON_TIME: "#4caf50",  # Green
-            TrainStatus.DELAYED: "#ff9800",  # Orange
-            TrainStatus.CANCELLED: "#f44336",  # Red
-            TrainStatus.UNKNOWN: "#666666",  # Gray
-        }
-        return dark_color_map[self.status]
+        return _DARK_STATUS_COLORS[self.status]
 
     @property
     def status_color_light(self) -> str:
         """Get color code for status display in light theme."""
-        light_color_map = {
-            TrainStatus.ON_TIME: "#388e3c",  # Darker green
-            TrainStatus.DELAYED: "#f57c00",  # Darker orange
-            TrainStatus.CANCELLED: "#d32f2f",  # Darker red
-            TrainStatus.UNKNOWN: "#9e9e9e",  # Darker gray
-        }
-        return light_color_map[self.status]
+        return _LIGHT_STATUS_COLORS[self.status]
 
     def get_status_color(self, theme: str = "dark") -> str:
         """Get status color for the specified theme."""
+        return self.status_colors(theme)[self.status]
+
+    @staticmethod
+    def status_colors(theme: str = "dark") -> Dict[TrainStatus, str]:
+        """Get the status color map for the specified theme (shared; do not mutate)."""
         if theme == "light":
-            return self.status_color_light
-        return self.status_color
+            return _LIGHT_STATUS_COLORS
+        return _DARK_STATUS_COLORS
 
     def format_departure_time(self) -> str:
         """Format departure time for display (HH:MM)."""
@@ -166,6 +183,12 @@ class TrainData:
 
     def format_arrival_time(self) -> str:
         """Format estimated arrival time for display."""
+        return self.formatted_arrival_time
+
+    @cached_property
+    def formatted_arrival_time(self) -> str:
+        """Estimated arrival time for display, formatted once per instance."""
+        # Instances are immutable, so the formatted value never goes stale
         if self.estimated_arrival is None:
             return "Unknown"
         return self.estimated_arrival.strftime("%H:%M")
@@ -0,0 +1,47 @@
+"""Per-route memo of Underground segment classification.
+
+Companion to [`UndergroundFormatter`](src/ui/formatters/underground_formatter.py:42);
+kept separate to leave the formatter module under the <= 400 non-blank LOC gate.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+class CachedUndergroundLookup:
+    """Memoise underground classification of route segments for one train.
+
+    Exposes the same `is_underground_segment()` / `get_underground_system_info()`
+    pair as the wrapped formatter, cached by segment identity. Call `clear()`
+    whenever the route changes so ids of discarded segments are never reused.
+    """
+
+    def __init__(self, formatter: Any):
+        self._formatter = formatter
+        self._cache: dict[int, tuple[bool, dict[str, str]]] = {}
+
+    def clear(self) -> None:
+        """Forget all cached classifications."""
+        self._cache.clear()
+
+    def _lookup(self, segment: Any) -> tuple[bool, dict[str, str]]:
+        cached = self._cache.get(id(segment))
+        if cached is None:
+            is_underground = self._formatter.is_underground_segment(segment)
+            system_info = (
+                self._formatter.get_underground_system_info(segment)
+                if is_underground
+                else {}
+            )
+            cached = (is_underground, system_info)
+            self._cache[id(segment)] = cached
+        return cached
+
+    def is_underground_segment(self, segment: Any) -> bool:
+        """Cached `UndergroundFormatter.is_underground_segment()`."""
+        return self._lookup(segment)[0]
+
+    def get_underground_system_info(self, segment: Any) -> dict[str, str]:
+        """Cached `UndergroundFormatter.get_underground_system_info()`."""
+        return self._lookup(segment)[1]
@@ -7,7 +7,6 @@ with comprehensive station information and interchange detection.
 
 import logging
 import sys
-from pathlib import Path
 from typing import List, Optional, Dict
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -18,10 +17,11 @@ from PySide6.QtGui import QFont
 from ...models.train_data import TrainData, CallingPoint
 from ...ui.formatters.underground_formatter import UndergroundFormatter
 from .train_widgets_base import BaseTrainWidget
+from .train_components.station_names import station_name_markers
 from .route_display_dialog_helpers import (
     build_route_dialog_stylesheet,
-    build_station_to_files_mapping,
     station_has_underground_connection,
+    underground_endpoint_stations,
 )
 
 logger = logging.getLogger(__name__)
@@ -58,9 +58,9 @@ class RouteDisplayDialog(QDialog):
         self.underground_formatter = UndergroundFormatter()
         
         # Cache for station data to avoid repeated loading
-        self._station_to_files_cache: Optional[Dict] = None
         self._line_to_file_cache: Optional[Dict] = None
         self._station_coordinates_cache: Optional[Dict] = None
+        self._underground_endpoints: Optional[frozenset] = None
         
         # Format destination with underground indicator if needed
         destination_text = self._format_station_name(train_data.destination)
@@ -247,8 +247,15 @@ class RouteDisplayDialog(QDialog):
         
         # Format station name with underground indicator if needed
         formatted_name = self._format_station_name(calling_point.station_name)
+        # Only HTML markers need the rich-text parser; plain names skip it,
+        # with whitespace collapsed as the HTML renderer would
+        is_html, is_walking = station_name_markers(calling_point.station_name)
+        if is_html:
+            station_label.setTextFormat(Qt.TextFormat.RichText)
+        else:
+            station_label.setTextFormat(Qt.TextFormat.PlainText)
+            formatted_name = " ".join(formatted_name.split())
         station_label.setText(formatted_name)
-        station_label.setTextFormat(Qt.TextFormat.RichText)
         
         station_font = QFont()
         station_font.setPointSize(11)
@@ -296,26 +303,17 @@ class RouteDisplayDialog(QDialog):
             station_layout.addWidget(platform_label)
 
         # Apply styling based on station type
-        self._style_station_frame(station_frame, calling_point)
+        self._style_station_frame(station_frame, calling_point, is_walking)
 
         return station_frame
 
-    def _style_station_frame(self, frame: QFrame, calling_point: CallingPoint) -> None:
+    def _style_station_frame(self, frame: QFrame, calling_point: CallingPoint, is_walking: bool) -> None:
         """Apply styling to station frame based on station type."""
         station_name = calling_point.station_name
-        is_walking = ("<font color='#f44336'" in station_name)
         
-        # Check if this is part of an Underground segment
-        is_underground_station = False
-        if hasattr(self.train_data, 'route_segments') and self.train_data.route_segments:
-            for segment in self.train_data.route_segments:
-                if self.underground_formatter.is_underground_segment(segment):
-                    segment_from = getattr(segment, 'from_station', '')
-                    segment_to = getattr(segment, 'to_station', '')
-                    
-                    if station_name == segment_from or station_name == segment_to:
-                        is_underground_station = True
-                        break
+        # Check if this is part of an Underground segment; the segments are
+        # classified once per dialog, not once per station
+        is_underground_station = station_name in self._underground_endpoint_names()
         
         if calling_point.is_origin:
             frame.setStyleSheet("""
@@ -421,18 +419,15 @@ class RouteDisplayDialog(QDialog):
             logger.debug(f"[RouteDialog] No route segments available for {clean_name}")
             return False
 
-    def _get_station_to_json_files_mapping(self) -> Dict:
-        """Create a mapping of station names to the JSON files they appear in."""
-        if self._station_to_files_cache is not None:
-            return self._station_to_files_cache
-        
-        self._station_to_files_cache = self._build_station_to_files_mapping()
-        return self._station_to_files_cache
-    
-    def _build_station_to_files_mapping(self) -> Dict:
-        """Build the mapping of stations to JSON files by loading all line data."""
-        lines_dir = Path(__file__).parent.parent.parent / "data" / "lines"
-        return build_station_to_files_mapping(lines_dir)
+    def _underground_endpoint_names(self) -> frozenset:
+        """Return the stations that start or end an Underground segment."""
+        if self._underground_endpoints is None:
+            # TrainData is immutable, so the endpoint set is built once per dialog.
+            self._underground_endpoints = underground_endpoint_stations(
+                train_data=self.train_data,
+                underground_formatter=self.underground_formatter,
+            )
+        return self._underground_endpoints
     
     def _format_station_name(self, station_name: str) -> str:
         """Format station name with Underground indicator."""
@@ -440,6 +435,7 @@ class RouteDisplayDialog(QDialog):
             train_data=self.train_data,
             underground_formatter=self.underground_formatter,
             station_name=station_name,
+            endpoints=self._underground_endpoint_names(),
         ):
             return station_name + " 🚇"
 
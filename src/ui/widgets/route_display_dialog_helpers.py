@@ -6,126 +6,132 @@ The helpers are UI-layer utilities and should not import from the core domain.
 
 from __future__ import annotations
 
-import json
 import logging
-from pathlib import Path
+import re
 from typing import Any
 
 
 logger = logging.getLogger(__name__)
 
 
+_QSS_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _compact_qss(stylesheet: str) -> str:
+    """Collapse whitespace once so Qt's QSS tokenizer has less to scan."""
+
+    return _QSS_WHITESPACE_RE.sub(" ", stylesheet).strip()
+
+
+_DARK_DIALOG_STYLESHEET = _compact_qss(
+    """
+    QDialog {
+        background-color: #1a1a1a;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+        background-color: transparent;
+    }
+    QPushButton {
+        background-color: #1976d2;
+        color: #000000;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1565c0;
+    }
+    QScrollArea {
+        border: 1px solid #404040;
+        border-radius: 4px;
+        background-color: #1a1a1a;
+    }
+    """
+)
+
+_LIGHT_DIALOG_STYLESHEET = _compact_qss(
+    """
+    QDialog {
+        background-color: #ffffff;
+        color: #212121;
+    }
+    QLabel {
+        color: #212121;
+        background-color: transparent;
+    }
+    QPushButton {
+        background-color: #1976d2;
+        color: #ffffff;
+        border: none;
+        border-radius: 4px;
+        padding: 8px 16px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #1565c0;
+    }
+    QScrollArea {
+        border: 1px solid #e0e0e0;
+        border-radius: 4px;
+        background-color: #ffffff;
+    }
+    """
+)
+
+
 def build_route_dialog_stylesheet(theme: str) -> str:
     """Return the dialog stylesheet for a given theme name."""
 
     if theme == "dark":
-        return """
-            QDialog {
-                background-color: #1a1a1a;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-                background-color: transparent;
-            }
-            QPushButton {
-                background-color: #1976d2;
-                color: #000000;
-                border: none;
-                border-radius: 4px;
-                padding: 8px 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #1565c0;
-            }
-            QScrollArea {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                background-color: #1a1a1a;
-            }
-        """
-
-    return """
-        QDialog {
-            background-color: #ffffff;
-            color: #212121;
-        }
-        QLabel {
-            color: #212121;
-            background-color: transparent;
-        }
-        QPushButton {
-            background-color: #1976d2;
-            color: #ffffff;
-            border: none;
-            border-radius: 4px;
-            padding: 8px 16px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #1565c0;
-        }
-        QScrollArea {
-            border: 1px solid #e0e0e0;
-            border-radius: 4px;
-            background-color: #ffffff;
-        }
-    """
+        return _DARK_DIALOG_STYLESHEET
 
+    return _LIGHT_DIALOG_STYLESHEET
 
-def station_has_underground_connection(
+
+def underground_endpoint_stations(
     *,
     train_data: Any,
     underground_formatter: Any,
-    station_name: str,
-) -> bool:
-    """Return True if `station_name` is an endpoint of an underground segment."""
+) -> frozenset[str]:
+    """Return the station names that start or end an underground segment.
+
+    Built with a single pass over `route_segments` so per-station checks in
+    `station_has_underground_connection()` become set lookups.
+    """
 
     if not hasattr(train_data, "route_segments") or not train_data.route_segments:
-        return False
+        return frozenset()
 
+    endpoints: set[str] = set()
     for segment in train_data.route_segments:
         if underground_formatter.is_underground_segment(segment):
-            segment_from = getattr(segment, "from_station", "")
-            segment_to = getattr(segment, "to_station", "")
-
-            if station_name == segment_from or station_name == segment_to:
-                return True
-
-    return False
-
-
-def build_station_to_files_mapping(lines_dir: Path) -> dict[str, list[str]]:
-    """Build mapping of station name -> list of line JSON filenames."""
-
-    station_to_files: dict[str, list[str]] = {}
-
-    if not lines_dir.exists():
-        logger.error("Lines directory not found: %s", lines_dir)
-        return {}
+            endpoints.add(getattr(segment, "from_station", ""))
+            endpoints.add(getattr(segment, "to_station", ""))
 
-    try:
-        for json_file in lines_dir.glob("*.json"):
-            with open(json_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    return frozenset(endpoints)
 
-            stations = data.get("stations", [])
-            file_name = json_file.stem
 
-            for station in stations:
-                station_name = station.get("name", "")
-                if not station_name:
-                    continue
+def station_has_underground_connection(
+    *,
+    train_data: Any,
+    underground_formatter: Any,
+    station_name: str,
+    endpoints: frozenset[str] | None = None,
+) -> bool:
+    """Return True if `station_name` is an endpoint of an underground segment.
 
-                station_to_files.setdefault(station_name, []).append(file_name)
+    Callers checking many stations of the same train should pass `endpoints`
+    from `underground_endpoint_stations()` to avoid rescanning the route
+    segments per station.
+    """
 
-        logger.debug(
-            "Built station-to-files mapping with %s stations", len(station_to_files)
+    if endpoints is None:
+        endpoints = underground_endpoint_stations(
+            train_data=train_data,
+            underground_formatter=underground_formatter,
         )
-        return station_to_files
-
-    except Exception as e:
-        logger.error("Failed to build station-to-files mapping: %s", e)
-        return {}
 
+    return station_name in endpoints
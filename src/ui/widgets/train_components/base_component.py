@@ -6,12 +6,61 @@ ensuring consistent theming and behavior.
 """
 
 import logging
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Optional
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import Qt
+from PySide6.QtGui import QFont
+
+from .label_styling import label_stylesheet
 
 logger = logging.getLogger(__name__)
 
+# Light theme colors; shared read-only by every component
+_LIGHT_THEME_COLORS: Mapping[str, str] = MappingProxyType({
+    "background_primary": "#ffffff",
+    "background_secondary": "#f5f5f5",
+    "background_hover": "#e3f2fd",
+    "text_primary": "#212121",
+    "text_secondary": "#757575",
+    "border_primary": "#e0e0e0",
+    "primary_accent": "#1976d2",
+    "secondary_accent": "#03a9f4",
+    "warning": "#ff9800",
+    "error": "#f44336",
+    "success": "#4caf50",
+})
+
+# Dark theme colors; shared read-only by every component
+_DARK_THEME_COLORS: Mapping[str, str] = MappingProxyType({
+    "background_primary": "#121212",
+    "background_secondary": "#1e1e1e",
+    "background_hover": "#2c2c2c",
+    "text_primary": "#ffffff",
+    "text_secondary": "#b0b0b0",
+    "border_primary": "#333333",
+    "primary_accent": "#90caf9",
+    "secondary_accent": "#4fc3f7",
+    "warning": "#ffb74d",
+    "error": "#e57373",
+    "success": "#81c784",
+})
+
+
+@lru_cache(maxsize=None)
+def _shared_font(point_size: int, bold: bool, italic: bool) -> QFont:
+    # Built on first use, once a QApplication exists, not at import time
+    font = QFont()
+    font.setPointSize(point_size)
+    # Only set attributes that differ from the default, so the rest still
+    # resolve against the parent widget's font as before
+    if bold:
+        font.setBold(True)
+    if italic:
+        font.setItalic(True)
+    return font
+
 
 class BaseTrainComponent(QWidget):
     """
@@ -23,10 +72,10 @@ class BaseTrainComponent(QWidget):
     def __init__(self, parent=None):
         """Initialize base train component."""
         super().__init__(parent)
-        self._theme_colors: Dict[str, str] = {}
+        self._theme_colors: Mapping[str, str] = {}
         self._current_theme = "dark"  # Default theme
     
-    def get_theme_colors(self, theme: str) -> Dict[str, str]:
+    def get_theme_colors(self, theme: str) -> Mapping[str, str]:
         """
         Get color palette for the current theme.
         
@@ -34,37 +83,36 @@ class BaseTrainComponent(QWidget):
             theme: Current theme ("dark" or "light")
             
         Returns:
-            Dictionary of colors for the theme
+            Mapping of colors for the theme (shared and read-only)
         """
+        # Every train row asks for the same palettes; share them
         if theme == "light":
-            return {
-                "background_primary": "#ffffff",
-                "background_secondary": "#f5f5f5",
-                "background_hover": "#e3f2fd",
-                "text_primary": "#212121",
-                "text_secondary": "#757575",
-                "border_primary": "#e0e0e0",
-                "primary_accent": "#1976d2",
-                "secondary_accent": "#03a9f4",
-                "warning": "#ff9800",
-                "error": "#f44336",
-                "success": "#4caf50"
-            }
-        else:
-            # Dark theme colors
-            return {
-                "background_primary": "#121212",
-                "background_secondary": "#1e1e1e",
-                "background_hover": "#2c2c2c",
-                "text_primary": "#ffffff",
-                "text_secondary": "#b0b0b0",
-                "border_primary": "#333333",
-                "primary_accent": "#90caf9",
-                "secondary_accent": "#4fc3f7",
-                "warning": "#ffb74d",
-                "error": "#e57373",
-                "success": "#81c784"
-            }
+            return _LIGHT_THEME_COLORS
+        return _DARK_THEME_COLORS
+    
+    def get_font(self, point_size: int, bold: bool = False, italic: bool = False) -> QFont:
+        """
+        Get a font for the component's labels.
+        
+        Args:
+            point_size: Font point size
+            bold: Whether the font is bold
+            italic: Whether the font is italic
+            
+        Returns:
+            Font with the requested attributes (shared; do not mutate)
+        """
+        # Every train row uses the same handful of fonts; share them
+        return _shared_font(point_size, bold, italic)
+    
+    def get_label_stylesheet(self) -> str:
+        """
+        Get the plain QLabel stylesheet for the current theme.
+        
+        Returns:
+            Stylesheet string, formatted once per theme and shared
+        """
+        return label_stylesheet(self._current_theme, self._theme_colors)
     
     def apply_theme(self, theme: str) -> None:
         """
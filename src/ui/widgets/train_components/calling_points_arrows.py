@@ -1,39 +1,71 @@
-"""Arrow-label builder for [`CallingPointsManager`](src/ui/widgets/train_components/calling_points_manager.py:25).
+"""Arrow markup builder for [`CallingPointsManager`](src/ui/widgets/train_components/calling_points_manager.py:25).
 
 Extracted to keep modules under the <= 400 non-blank LOC gate.
 """
 
 from __future__ import annotations
 
+from functools import lru_cache
+from html import escape
 from typing import Any, Mapping
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QLabel
+from .station_names import normalized_station_name
 
 
-def _is_html(text: str) -> bool:
-    return "<font" in text and "</font>" in text
+ARROW_WALKING = "walking"
+ARROW_UNDERGROUND = "underground"
 
+# Arrow texts; the default arrow is padded to roughly its old fixed width.
+_ARROW = "   →   "
+# Walking and Underground arrows wrap their connection info the same way
+_SPECIAL_ARROW_FMT = "  → {} →  "
 
-def _normalized_station_name(raw: str) -> str:
-    return raw if _is_html(raw) else raw.strip()
+# Inline CSS for each arrow kind; arrows are drawn smaller than station names.
+_SPECIAL_ARROW_CSS = {
+    ARROW_WALKING: "color:#f44336; font-size:15pt",
+    ARROW_UNDERGROUND: "color:#DC241F; font-size:15pt; font-weight:bold",
+}
+
+
+def _span(css: str, text: str) -> str:
+    # Non-breaking spaces keep the arrow padding, which rich text would collapse.
+    return f"<span style='{css}'>{escape(text).replace(' ', '&nbsp;')}</span>"
+
+
+@lru_cache(maxsize=256)
+def _special_arrow_html(kind: str, arrow_text: str) -> str:
+    return _span(_SPECIAL_ARROW_CSS[kind], arrow_text)
+
+
+@lru_cache(maxsize=8)
+def _default_arrow_html(accent: str) -> str:
+    return _span(f"color:{accent}; font-size:15pt", _ARROW)
 
 
 def _segments_iter(train_data: Any):
-    if not train_data:
-        return []
-    if not hasattr(train_data, "route_segments") or not train_data.route_segments:
-        return []
-    return train_data.route_segments
+    return getattr(train_data, "route_segments", None) or ()
 
 
-def _segment_connects(segment: Any, a: str, b: str) -> bool:
-    raw_from = getattr(segment, "from_station", "")
-    raw_to = getattr(segment, "to_station", "")
-    seg_from = _normalized_station_name(raw_from)
-    seg_to = _normalized_station_name(raw_to)
+def _segment_index(segments: Any) -> dict[frozenset[str], list[Any]]:
+    """Return segments grouped by their normalised (unordered) endpoint pair."""
 
-    return (seg_from == a and seg_to == b) or (seg_from == b and seg_to == a)
+    index: dict[frozenset[str], list[Any]] = {}
+    for segment in segments:
+        key = frozenset(
+            (
+                normalized_station_name(getattr(segment, "from_station", "")),
+                normalized_station_name(getattr(segment, "to_station", "")),
+            )
+        )
+        index.setdefault(key, []).append(segment)
+    return index
+
+
+def _is_walking_segment(segment: Any) -> bool:
+    return (
+        getattr(segment, "line_name", "") == "WALKING"
+        or getattr(segment, "service_pattern", "") == "WALKING"
+    )
 
 
 def _walk_info(segment: Any) -> str:
@@ -47,97 +79,71 @@ def _walk_info(segment: Any) -> str:
     return "Walking connection"
 
 
-def build_arrow_label(
-    *,
+def _arrow_spec(segments: list[Any], underground_formatter: Any) -> tuple[str, str] | None:
+    """Classify the segments joining one station pair as `(kind, arrow_text)`."""
+
+    # Walking connections win over underground ones; both are resolved from a
+    # single pass over the segments joining this station pair.
+    underground_segment = None
+    for segment in segments:
+        if _is_walking_segment(segment):
+            return ARROW_WALKING, _SPECIAL_ARROW_FMT.format(_walk_info(segment))
+
+        if underground_segment is None and underground_formatter.is_underground_segment(
+            segment
+        ):
+            underground_segment = segment
+
+    if underground_segment is None:
+        return None
+
+    system_info = underground_formatter.get_underground_system_info(underground_segment)
+    system_name = system_info.get("short_name", "Underground")
+    time_range = system_info.get("time_range", "10-40min")
+    emoji = system_info.get("emoji", "🚇")
+    underground_info = f"{emoji} {system_name} ({time_range})"
+    return ARROW_UNDERGROUND, _SPECIAL_ARROW_FMT.format(underground_info)
+
+
+def precompute_arrow_specs(
     train_data: Any,
     underground_formatter: Any,
-    theme: str,
+) -> dict[frozenset[str], tuple[str, str]]:
+    """Return `(kind, arrow_text)` for every station pair joined by a special segment.
+
+    Keys are unordered pairs of normalised station names. Pairs without a
+    walking or underground segment are absent and render the default arrow.
+    """
+
+    specs: dict[frozenset[str], tuple[str, str]] = {}
+    for key, segments in _segment_index(_segments_iter(train_data)).items():
+        spec = _arrow_spec(segments, underground_formatter)
+        if spec is not None:
+            specs[key] = spec
+    return specs
+
+
+def arrow_html(
+    *,
     theme_colors: Mapping[str, str],
     prev_station_raw: str,
     curr_station_raw: str,
-) -> QLabel:
-    """Build the label used between two adjacent calling points."""
-
-    prev_station = _normalized_station_name(prev_station_raw or "")
-    curr_station = _normalized_station_name(curr_station_raw or "")
-
-    # 1) Walking connections
-    for segment in _segments_iter(train_data):
-        if not _segment_connects(segment, prev_station, curr_station):
-            continue
-
-        line_name = getattr(segment, "line_name", "")
-        service_pattern = getattr(segment, "service_pattern", "")
-        is_walking = line_name == "WALKING" or service_pattern == "WALKING"
-        if not is_walking:
-            continue
-
-        arrow_text = f"  → {_walk_info(segment)} →  "
-        label = QLabel(arrow_text)
-        label.setWordWrap(False)
-        label.setTextFormat(Qt.TextFormat.PlainText)
-        label.setStyleSheet(
-            """
-            QLabel {
-                background-color: transparent;
-                color: #f44336;
-                border: none;
-                margin: 0px;
-                padding-left: 4px;
-                padding-right: 4px;
-            }
-            """
-        )
-        return label
-
-    # 2) Underground black-box segments
-    for segment in _segments_iter(train_data):
-        if not _segment_connects(segment, prev_station, curr_station):
-            continue
-        if not underground_formatter.is_underground_segment(segment):
-            continue
-
-        system_info = underground_formatter.get_underground_system_info(segment)
-        system_name = system_info.get("short_name", "Underground")
-        time_range = system_info.get("time_range", "10-40min")
-        emoji = system_info.get("emoji", "🚇")
-        underground_info = f"{emoji} {system_name} ({time_range})"
-
-        arrow_text = f"  → {underground_info} →  "
-        label = QLabel(arrow_text)
-        label.setWordWrap(False)
-        label.setTextFormat(Qt.TextFormat.PlainText)
-        label.setStyleSheet(
-            """
-            QLabel {
-                background-color: transparent;
-                color: #DC241F;
-                border: none;
-                margin: 0px;
-                padding-left: 4px;
-                padding-right: 4px;
-                font-weight: bold;
-            }
-            """
-        )
-        return label
+    arrow_specs: Mapping[frozenset[str], tuple[str, str]],
+) -> str:
+    """Return the rich-text arrow drawn between two adjacent calling points.
 
-    # 3) Default arrow
-    label = QLabel("  →  ")
-    label.setWordWrap(False)
-    label.setTextFormat(Qt.TextFormat.PlainText)
-    label.setStyleSheet(
-        f"""
-        QLabel {{
-            background-color: transparent;
-            color: {theme_colors['primary_accent']};
-            border: none;
-            margin: 0px;
-            padding-left: 4px;
-            padding-right: 4px;
-        }}
-        """
-    )
-    label.setFixedWidth(50)
-    return label
+    `arrow_specs` comes from `precompute_arrow_specs()` (built once per train),
+    so each arrow is a single dict lookup instead of a pass over
+    `route_segments`.
+    """
 
+    prev_station = normalized_station_name(prev_station_raw or "")
+    curr_station = normalized_station_name(curr_station_raw or "")
+    spec = arrow_specs.get(frozenset((prev_station, curr_station)))
+
+    # 1) Walking connections / 2) Underground black-box segments
+    if spec is not None:
+        return _special_arrow_html(*spec)
+
+    # 3) Default arrow
+    return _default_arrow_html(theme_colors["primary_accent"])
@@ -6,23 +6,21 @@ with proper formatting and styling.
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QVBoxLayout, QHBoxLayout, QLabel, QWidget, QSizePolicy
 )
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+from PySide6.QtCore import Qt, QTimer
 
 from .base_component import BaseTrainComponent
 from .station_filter_service import StationFilterService
 from ....models.train_data import TrainData, CallingPoint
 from ....ui.formatters.underground_formatter import UndergroundFormatter
-from .calling_points_styling import (
-    stylesheet_for_direct_label,
-    stylesheet_for_station_label,
-)
-from .calling_points_arrows import build_arrow_label
+from ....ui.formatters.underground_segment_cache import CachedUndergroundLookup
+from .calling_points_styling import station_text_colors
+from .calling_points_arrows import precompute_arrow_specs
+from .calling_points_markup import calling_point_lines, derive_station_view
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +33,11 @@ class CallingPointsManager(BaseTrainComponent):
     proper styling and indicators.
     """
     
-    def __init__(self, train_data: Optional[TrainData] = None, theme: str = "dark", parent=None):
+    # Delay used to coalesce rapid set_train_data() calls (milliseconds)
+    REFRESH_DELAY_MS = 50
+    
+    def __init__(self, train_data: Optional[TrainData] = None, theme: str = "dark", parent=None,
+                 underground_formatter: Optional[UndergroundFormatter] = None):
         """
         Initialize calling points manager.
         
@@ -43,16 +45,42 @@ class CallingPointsManager(BaseTrainComponent):
             train_data: Train data containing calling points
             theme: Current theme ("dark" or "light")
             parent: Parent widget
+            underground_formatter: Optional formatter shared between rows; a
+                private one is created when omitted
         """
         super().__init__(parent)
         
         self.train_data = train_data
         self._current_theme = theme
         self._theme_colors = self.get_theme_colors(theme)
+        self._station_colors = station_text_colors(theme, self._theme_colors)
         
         # Initialize services
-        self.station_filter_service = StationFilterService(train_data)
-        self.underground_formatter = UndergroundFormatter()
+        self.underground_formatter = underground_formatter or UndergroundFormatter()
+        # Segment classification is shared by the arrow specs and the station
+        # filter, and memoised until the train changes.
+        self._underground_lookup = CachedUndergroundLookup(self.underground_formatter)
+        self.station_filter_service = StationFilterService(
+            train_data, underground_formatter=self._underground_lookup
+        )
+        self._arrow_specs = precompute_arrow_specs(train_data, self._underground_lookup)
+        # Signature of what is currently on screen; see _render_signature().
+        self._rendered_signature: Optional[tuple] = None
+        # Lines currently on screen (None: direct service); see _display_lines()
+        self._rendered_lines: Optional[Tuple[str, ...]] = ()
+        
+        # Coalesce bursts of set_train_data() calls into a single rebuild
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._refresh_pending = False
+        
+        # Fonts are shared across rows; bold/italic station emphasis is inline markup
+        self._font_line = self.get_font(18)
+        self._font_direct = self.get_font(18, italic=True)
+        
+        # Direct-service row, built on first use and then only shown or hidden
+        self._direct_row: Optional[QWidget] = None
         
         # Setup UI
         self._setup_ui()
@@ -65,9 +93,56 @@ class CallingPointsManager(BaseTrainComponent):
         Args:
             train_data: Updated train data
         """
+        if train_data is not self.train_data:
+            self._underground_lookup.clear()
+            # Route segments are fixed per train, so index them once per
+            # update rather than scanning them for every arrow.
+            self._arrow_specs = precompute_arrow_specs(train_data, self._underground_lookup)
+
         self.train_data = train_data
         self.station_filter_service.set_train_data(train_data)
-        self._refresh_display()
+        
+        # Parents re-send the same train (e.g. on periodic refreshes); skip the
+        # teardown/rebuild when nothing that affects the output has changed.
+        if self._render_signature() == self._rendered_signature:
+            return
+        self._schedule_refresh()
+    
+    def showEvent(self, event) -> None:
+        """Build the display on first show, or catch up on updates made while hidden."""
+        super().showEvent(event)
+        if self._render_signature() != self._rendered_signature:
+            self._refresh_display()
+    
+    def _schedule_refresh(self) -> None:
+        """Schedule a display refresh, coalescing calls within the delay window."""
+        # Hidden rows are rebuilt by showEvent() instead
+        if self._refresh_pending or not self.isVisible():
+            return
+        self._refresh_pending = True
+        self._refresh_timer.start(self.REFRESH_DELAY_MS)
+    
+    def _do_refresh(self) -> None:
+        """Run a scheduled refresh for the latest train data."""
+        self._refresh_pending = False
+        if self.isVisible() and self._render_signature() != self._rendered_signature:
+            self._refresh_display()
+    
+    def _render_signature(self) -> tuple:
+        """
+        Return a cheap signature of everything the display is built from.
+        
+        `self.train_data` holds a reference to the train, so its id stays
+        stable while it is the current train.
+        """
+        train_data = self.train_data
+        calling_points = getattr(train_data, "calling_points", None) or ()
+        return (
+            id(train_data),
+            id(getattr(train_data, "route_segments", None)),
+            self._current_theme,
+            tuple((cp.station_name, cp.is_origin, cp.is_destination) for cp in calling_points),
+        )
     
     def _setup_ui(self) -> None:
         """Setup the calling points manager UI layout."""
@@ -76,43 +151,88 @@ class CallingPointsManager(BaseTrainComponent):
         self.main_layout.setSpacing(0)  # No spacing between layout elements
         
         # Create calling points container
+        # Unstyled: the manager's single widget-wide stylesheet (see
+        # _apply_theme_styles) covers its labels; colours are inline markup.
         self.calling_points_widget = QWidget()
-        self.calling_points_widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border: none;
-                margin: 0px;
-                padding: 0px;
-            }
-        """)
         
         self.calling_points_layout = QVBoxLayout(self.calling_points_widget)
         self.calling_points_layout.setContentsMargins(0, 0, 0, 0)
         self.calling_points_layout.setSpacing(0)  # No spacing for calling points
-        self.calling_points_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)  # Left-justify the layout
+        
+        # One rich-text label holds every line; refreshes only replace its text
+        self._stops_label = QLabel(self.calling_points_widget)
+        # Lines are broken explicitly in the markup, so Qt must not wrap
+        # them; the label fills the row width and clips rather than
+        # forcing the row wider
+        self._stops_label.setWordWrap(False)
+        self._stops_label.setTextFormat(Qt.TextFormat.RichText)  # Use RichText for HTML formatting
+        self._stops_label.setSizePolicy(QSizePolicy.Policy.Ignored, QSizePolicy.Policy.Preferred)
+        # Ensure no extra padding or margin
+        self._stops_label.setContentsMargins(0, 0, 0, 0)
+        self._stops_label.setFont(self._font_line)
+        self._stops_label.setVisible(False)
+        self.calling_points_layout.addWidget(self._stops_label)
         
         self.main_layout.addWidget(self.calling_points_widget)
         
         # Set size policy to allow expansion
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
         
-        # Initial display
-        self._refresh_display()
+        # No initial text: lines are built by showEvent(), so rows that are
+        # never shown never pay for them
     
     def _refresh_display(self) -> None:
         """Refresh the calling points display."""
-        # Clear existing content
-        self._clear_layout(self.calling_points_layout)
+        # A direct refresh supersedes any scheduled one
+        self._refresh_timer.stop()
+        self._refresh_pending = False
+        self._rendered_signature = self._render_signature()
+        
+        # Live updates usually deliver a new TrainData with the same stops;
+        # leave the widgets alone when the rendered lines would not change.
+        lines = self._display_lines()
+        if lines == self._rendered_lines:
+            return
+        self._rendered_lines = lines
+        
+        # Suspend painting so the rebuild lands as a single update/relayout
+        container = self.calling_points_widget
+        container.setUpdatesEnabled(False)
+        try:
+            if lines is None:
+                self._create_direct_service_display()
+            
+            # One rich-text label for every line; wrapping is markup
+            self._stops_label.setText("<br>".join(lines or ()))
+            self._stops_label.setVisible(bool(lines))
+            if self._direct_row is not None:
+                self._direct_row.setVisible(lines is None)
+        finally:
+            container.setUpdatesEnabled(True)
+        container.updateGeometry()
+    
+    def _display_lines(self) -> Optional[Tuple[str, ...]]:
+        """
+        Compute what the display should show for the current train data.
         
+        Returns:
+            Rich-text markup per line, an empty tuple when there is no train
+            data, or None for a direct service
+        """
         if not self.train_data:
-            return
+            return ()
         
         # Get all calling points
         all_calling_points = self.train_data.calling_points
         
         if not all_calling_points:
-            self._create_direct_service_display()
-            return
+            return None
+        
+        # Fast path: a lone calling point is only shown when the essential
+        # filter adds an Underground indicator next to it, which needs route
+        # segments. Otherwise skip both filter passes.
+        if len(all_calling_points) < 2 and not getattr(self.train_data, "route_segments", None):
+            return None
         
         # Filter calling points
         filtered_calling_points = self.station_filter_service.filter_calling_points(all_calling_points)
@@ -121,220 +241,58 @@ class CallingPointsManager(BaseTrainComponent):
         essential_calling_points = self.station_filter_service.filter_for_essential_stations_only(filtered_calling_points)
         
         if essential_calling_points and len(essential_calling_points) >= 2:
-            self._create_calling_points_display(essential_calling_points)
-        else:
-            self._create_direct_service_display()
+            return self._calling_point_lines(essential_calling_points)
+        return None
     
-    def _clear_layout(self, layout) -> None:
+    def _calling_point_lines(self, calling_points: List[CallingPoint]) -> Tuple[str, ...]:
         """
-        Clear all items from a layout.
+        Build the markup for calling points.
         
-        Args:
-            layout: Layout to clear
-        """
-        if layout is None:
-            return
-            
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
-            elif item.layout() is not None:
-                self._clear_layout(item.layout())
-                item.layout().deleteLater()
-    
-    def _create_calling_points_display(self, calling_points: List[CallingPoint]) -> None:
-        """
-        Create the display for calling points.
+        All lines share a single rich-text label, joined with <br>; station
+        and arrow styling is inlined as spans rather than spread over
+        per-item widgets.
         
         Args:
             calling_points: List of calling points to display
-        """
-        # Show "Stops:" prefix on first line
-        first_line_layout = QHBoxLayout()
-        first_line_layout.setSpacing(0)  # No spacing
-        first_line_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)  # Left-justify the layout
-        
-        stops_label = QLabel("Stops:")
-        stops_font = QFont()
-        stops_font.setPointSize(18)
-        stops_font.setBold(True)
-        stops_label.setFont(stops_font)
-        first_line_layout.addWidget(stops_label)
-        
-        # Limit stations per line to avoid truncation
-        max_stations_per_line = 3  # Allow 3 stations per line for better layout
-        current_line_layout = first_line_layout
-        stations_in_current_line = 0
-        
-        for i, calling_point in enumerate(calling_points):
-            station_name = calling_point.station_name.strip() if calling_point.station_name else ""
-            
-            # Check if we need a new line
-            if stations_in_current_line >= max_stations_per_line:
-                current_line_layout.addStretch()
-                self.calling_points_layout.addLayout(current_line_layout)
-                
-                # Start new line with indentation
-                current_line_layout = QHBoxLayout()
-                current_line_layout.setSpacing(0)  # No spacing
-                current_line_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)  # Left-justify the layout
-                
-                # Add indentation
-                indent_label = QLabel(" ")  # 1 space for indentation
-                current_line_layout.addWidget(indent_label)
-                stations_in_current_line = 0
-            
-            # Add arrow between stations
-            if i > 0:
-                self._add_station_arrow(current_line_layout, calling_points, i)
-            
-            # Create station label
-            station_label = self._create_station_label(calling_point)
-            current_line_layout.addWidget(station_label)
-            stations_in_current_line += 1
-        
-        # Finish the last line with stretch at the end
-        current_line_layout.addStretch(1)
-        self.calling_points_layout.addLayout(current_line_layout)
-    
-    def _add_station_arrow(self, layout: QHBoxLayout, calling_points: List[CallingPoint], index: int) -> None:
-        """
-        Add arrow between stations with walking connection detection.
-        
-        Args:
-            layout: Layout to add arrow to
-            calling_points: List of all calling points
-            index: Index of current calling point
-        """
-        raw_curr = calling_points[index].station_name if calling_points[index].station_name else ""
-        raw_prev = calling_points[index - 1].station_name if calling_points[index - 1].station_name else ""
-
-        colors = self.get_theme_colors(self._current_theme)
-        arrow_label = build_arrow_label(
-            train_data=self.train_data,
-            underground_formatter=self.underground_formatter,
-            theme=self._current_theme,
-            theme_colors=colors,
-            prev_station_raw=raw_prev,
-            curr_station_raw=raw_curr,
-        )
-
-        arrow_font = QFont()
-        arrow_font.setPointSize(15)
-        arrow_label.setFont(arrow_font)
-        layout.addWidget(arrow_label)
-    
-    def _create_station_label(self, calling_point: CallingPoint) -> QLabel:
-        """
-        Create a styled station label with underground system differentiation.
-        
-        Args:
-            calling_point: Calling point to create label for
             
         Returns:
-            Styled station label
-        """
-        station_label = QLabel()
-        
-        # Get station name and trim any leading and trailing spaces
-        raw_name = calling_point.station_name if calling_point.station_name else ""
-        
-        # Check if this is an HTML-formatted station name (like underground connections)
-        is_html_formatted = "<font" in raw_name and "</font>" in raw_name
-        
-        # For HTML-formatted names, we need to handle them differently
-        if is_html_formatted:
-            # Keep the HTML formatting but ensure consistent spacing
-            station_name = raw_name
-        else:
-            # For plain text names, just strip spaces
-            station_name = raw_name.strip()
-        
-        # Build the station text with appropriate indicators
-        station_text = station_name
-        
-        station_label.setText(station_text)
-        # Ensure text doesn't get truncated
-        station_label.setWordWrap(False)
-        station_label.setTextFormat(Qt.TextFormat.RichText)  # Use RichText for HTML formatting
-        station_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        
-        # Ensure no extra padding or margin
-        station_label.setContentsMargins(0, 0, 0, 0)
-        station_label.setStyleSheet("padding: 0px; margin: 0px;")
-        
-        station_font = QFont()
-        station_font.setPointSize(18)
-        
-        # Special formatting for origin and destination
-        if calling_point.is_origin or calling_point.is_destination:
-            station_font.setBold(True)
-        else:
-            station_font.setItalic(True)
-            
-        station_label.setFont(station_font)
-        
-        # Apply styling based on station type
-        self._style_station_label(station_label, calling_point)
-        
-        return station_label
-    
-    def _style_station_label(self, label: QLabel, calling_point: CallingPoint) -> None:
-        """
-        Apply styling to station label based on its type.
-        
-        Args:
-            label: Label to style
-            calling_point: Calling point data
+            Rich-text markup per line
         """
-        # Get raw station name
-        raw_name = calling_point.station_name if calling_point.station_name else ""
-        
-        # Check if this is an HTML-formatted station name
-        is_html_formatted = "<font" in raw_name and "</font>" in raw_name
-        
-        # Process station name based on whether it's HTML-formatted
-        if is_html_formatted:
-            station_name = raw_name  # Keep HTML formatting
-        else:
-            station_name = raw_name.strip()
-            
-        colors = self.get_theme_colors(self._current_theme)
-        
-        # Check for walking connections
-        is_walking = ("<font color='#f44336'" in station_name)
-        
-        is_user_interchange = self.station_filter_service.is_actual_user_journey_interchange(
-            station_name
-        )
-        label.setStyleSheet(
-            stylesheet_for_station_label(
-                theme=self._current_theme,
-                colors=colors,
-                is_walking=is_walking,
-                is_user_interchange=is_user_interchange,
-                is_origin_or_destination=(
-                    calling_point.is_origin or calling_point.is_destination
-                ),
-            )
-        )
+        # Interchange flags come from the filter service in one pass
+        interchange_flags = self.station_filter_service.user_interchange_flags(calling_points)
+        stations = [
+            derive_station_view(calling_point, is_interchange)
+            for calling_point, is_interchange in zip(calling_points, interchange_flags)
+        ]
+        
+        return tuple(calling_point_lines(
+            stations,
+            station_colors=self._station_colors,
+            theme_colors=self._theme_colors,
+            arrow_specs=self._arrow_specs,
+        ))
     
     def _create_direct_service_display(self) -> None:
         """Create display for direct service."""
-        direct_layout = QHBoxLayout()
-        direct_label = QLabel("Direct service")
-        direct_font = QFont()
-        direct_font.setPointSize(18)
-        direct_font.setItalic(True)
-        direct_label.setFont(direct_font)
-        direct_layout.addWidget(direct_label)
-        direct_layout.addStretch()
-        self.calling_points_layout.addLayout(direct_layout)
+        # Built once and kept at the top of the layout; later refreshes only
+        # toggle its visibility (see _refresh_display)
+        if self._direct_row is None:
+            self._direct_row = QWidget(self.calling_points_widget)
+            row_layout = QHBoxLayout(self._direct_row)
+            row_layout.setContentsMargins(0, 0, 0, 0)
+            
+            # Fixed wording, so text and font are set once; PlainText skips
+            # Qt's rich-text sniffing
+            direct_label = QLabel("Direct service", self._direct_row)
+            direct_label.setTextFormat(Qt.TextFormat.PlainText)
+            direct_label.setFont(self._font_direct)
+            row_layout.addWidget(direct_label)
+            row_layout.addStretch()
+            self.calling_points_layout.insertWidget(0, self._direct_row)
     
     def _apply_theme_styles(self) -> None:
         """Apply theme-specific styling."""
-        colors = self.get_theme_colors(self._current_theme)
+        colors = self._theme_colors
 
-        self.setStyleSheet(stylesheet_for_direct_label(self._current_theme, colors))
+        self._station_colors = station_text_colors(self._current_theme, colors)
+        self.setStyleSheet(self.get_label_stylesheet())
@@ -0,0 +1,106 @@
+"""Qt-free rich-text builder for [`CallingPointsManager`](src/ui/widgets/train_components/calling_points_manager.py:25).
+
+The per-station string work runs on every refresh, so it lives here as plain
+functions over strings: no Qt calls, no widget state. That keeps it cheap to
+unit test and lets ahead-of-time compilers (the Windows build uses Nuitka)
+treat it as ordinary compiled code.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Mapping, NamedTuple, Sequence
+
+from .calling_points_arrows import arrow_html
+from .calling_points_styling import (
+    STATION_STYLE_ENDPOINT,
+    STATION_STYLE_INTERCHANGE,
+    STATION_STYLE_NORMAL,
+    STATION_STYLE_WALKING,
+)
+from .station_names import station_name_markers
+
+
+STOPS_PREFIX = "<b>Stops:</b>&nbsp;"
+LINE_INDENT = "&nbsp;"
+STATIONS_PER_LINE = 3  # Allow 3 stations per line for better layout
+
+
+class StationView(NamedTuple):
+    """Per-refresh derived fields for one calling point."""
+
+    raw_name: str
+    display_name: str
+    is_endpoint: bool
+    style_kind: str
+
+
+def derive_station_view(calling_point: Any, is_interchange: bool) -> StationView:
+    """Derive the display fields of a calling point once per refresh.
+
+    `is_interchange` comes precomputed from the station filter service
+    (`StationFilterService.user_interchange_flags`).
+    """
+
+    raw_name = calling_point.station_name if calling_point.station_name else ""
+
+    # HTML-formatted names (like underground connections) keep their markup;
+    # plain text names just have surrounding spaces trimmed. Walking
+    # connections are detected in the same pass.
+    is_html, is_walking = station_name_markers(raw_name)
+    display_name = raw_name if is_html else raw_name.strip()
+    is_endpoint = calling_point.is_origin or calling_point.is_destination
+
+    if is_walking:
+        style_kind = STATION_STYLE_WALKING
+    elif is_interchange:
+        style_kind = STATION_STYLE_INTERCHANGE
+    elif is_endpoint:
+        style_kind = STATION_STYLE_ENDPOINT
+    else:
+        style_kind = STATION_STYLE_NORMAL
+
+    return StationView(raw_name, display_name, is_endpoint, style_kind)
+
+
+def station_html(station: StationView, color: str | None) -> str:
+    """Return a station name wrapped in a span carrying its colour and emphasis."""
+
+    # Special formatting for origin and destination
+    css = "font-weight:bold" if station.is_endpoint else "font-style:italic"
+    if color is not None:
+        css = f"color:{color}; {css}"
+    return f"<span style='{css}'>{station.display_name}</span>"
+
+
+def calling_point_lines(
+    stations: Sequence[StationView],
+    *,
+    station_colors: Mapping[str, str | None],
+    theme_colors: Mapping[str, str],
+    arrow_specs: Mapping[frozenset[str], tuple[str, str]],
+    stations_per_line: int = STATIONS_PER_LINE,
+) -> list[str]:
+    """Return the rich-text markup of each displayed line of calling points."""
+
+    lines: list[str] = []
+    prev: StationView | None = None
+
+    # Limit stations per line to avoid truncation; the line is chosen by
+    # slicing rather than by counting stations inside the loop
+    for start in range(0, len(stations), stations_per_line):
+        fragments = [STOPS_PREFIX if start == 0 else LINE_INDENT]
+        for station in stations[start:start + stations_per_line]:
+            if prev is not None:
+                fragments.append(
+                    arrow_html(
+                        theme_colors=theme_colors,
+                        prev_station_raw=prev.raw_name,
+                        curr_station_raw=station.raw_name,
+                        arrow_specs=arrow_specs,
+                    )
+                )
+            fragments.append(station_html(station, station_colors[station.style_kind]))
+            prev = station
+        lines.append("".join(fragments))
+
+    return lines
@@ -4,93 +4,36 @@ from __future__ import annotations
 
 from typing import Mapping
 
+from .label_styling import label_stylesheet
 
-def stylesheet_for_direct_label(theme: str, colors: Mapping[str, str]) -> str:
-    """Return a label stylesheet for direct/standard cases."""
 
-    if theme == "light":
-        return """
-            QLabel {
-                color: #212121;
-                background-color: transparent;
-                border: none;
-                margin: 0px;
-                padding: 0px;
-            }
-        """
-
-    return f"""
-        QLabel {{
-            color: {colors['text_primary']};
-            background-color: transparent;
-            border: none;
-            margin: 0px;
-            padding: 0px;
-        }}
-    """
+# The plain label style is shared with the other train components; kept
+# here under its original name for calling-points callers
+stylesheet_for_direct_label = label_stylesheet
 
 
-def stylesheet_for_station_label(
-    *,
-    theme: str,
-    colors: Mapping[str, str],
-    is_walking: bool,
-    is_user_interchange: bool,
-    is_origin_or_destination: bool,
-) -> str:
-    """Return the label stylesheet used for station display."""
+STATION_STYLE_WALKING = "walking"
+STATION_STYLE_INTERCHANGE = "interchange"
+STATION_STYLE_ENDPOINT = "endpoint"
+STATION_STYLE_NORMAL = "normal"
 
-    if is_walking:
-        return """
-            QLabel {
-                background-color: transparent !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }
-        """
 
-    if is_user_interchange:
-        interchange_color = colors["warning"]
-        return f"""
-            QLabel {{
-                background-color: transparent !important;
-                color: {interchange_color} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-        """
+def station_text_colors(theme: str, colors: Mapping[str, str]) -> dict[str, str | None]:
+    """Return the inline text colour for every station kind in a theme.
 
-    if is_origin_or_destination and theme == "light":
-        return """
-            QLabel {
-                background-color: transparent !important;
-                color: #1976d2 !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }
-        """
-
-    if is_origin_or_destination:
-        return f"""
-            QLabel {{
-                background-color: transparent !important;
-                color: {colors['text_primary']} !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-            }}
-        """
-
-    return f"""
-        QLabel {{
-            background-color: transparent !important;
-            color: {colors['primary_accent']} !important;
-            border: none !important;
-            margin: 0px !important;
-            padding: 0px !important;
-        }}
+    Walking stations map to `None`: their names already carry their own
+    `<font color=...>` markup. Rendered once per theme change so per-station
+    colouring is a dict lookup.
     """
 
+    if theme == "light":
+        endpoint_color = "#1976d2"
+    else:
+        endpoint_color = colors["text_primary"]
+
+    return {
+        STATION_STYLE_WALKING: None,
+        STATION_STYLE_INTERCHANGE: colors["warning"],
+        STATION_STYLE_ENDPOINT: endpoint_color,
+        STATION_STYLE_NORMAL: colors["primary_accent"],
+    }
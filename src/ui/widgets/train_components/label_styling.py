@@ -0,0 +1,35 @@
+"""Plain label styling shared by the train widget components.
+
+Qt-free: only builds stylesheet strings, so both the components and the
+Qt-free markup helpers can import it.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Mapping
+
+
+def label_stylesheet(theme: str, colors: Mapping[str, str]) -> str:
+    """Return the plain QLabel stylesheet for a theme.
+
+    Every train row shares the same string per theme, so Qt sees identical
+    stylesheets and the f-string is formatted once.
+    """
+
+    if theme == "light":
+        return _label_stylesheet("#212121")
+    return _label_stylesheet(colors["text_primary"])
+
+
+@lru_cache(maxsize=8)
+def _label_stylesheet(text_color: str) -> str:
+    return f"""
+        QLabel {{
+            color: {text_color};
+            background-color: transparent;
+            border: none;
+            margin: 0px;
+            padding: 0px;
+        }}
+    """
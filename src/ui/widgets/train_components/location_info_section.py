@@ -12,7 +12,6 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QLabel, QSizePolicy
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 
 from .base_component import BaseTrainComponent
 from ....models.train_data import TrainData
@@ -41,6 +40,8 @@ class LocationInfoSection(BaseTrainComponent):
         self.train_data = train_data
         self._current_theme = theme
         self._theme_colors = self.get_theme_colors(theme)
+        # (current_location, estimated_arrival) last rendered; see _update_display()
+        self._last_loc_key = None
         
         # Setup UI
         self._setup_ui()
@@ -62,11 +63,12 @@ class LocationInfoSection(BaseTrainComponent):
         location_layout.setContentsMargins(0, 0, 0, 0)
         location_layout.setSpacing(1)  # Minimal spacing
         
+        # Both labels use the same shared font
+        info_font = self.get_font(18)
+        
         # Current location
         self.location_info = QLabel()
-        location_font = QFont()
-        location_font.setPointSize(18)
-        self.location_info.setFont(location_font)
+        self.location_info.setFont(info_font)
         location_layout.addWidget(self.location_info)
         
         location_layout.addStretch()
@@ -74,9 +76,7 @@ class LocationInfoSection(BaseTrainComponent):
         # Arrival time
         self.arrival_info = QLabel()
         self.arrival_info.setAlignment(Qt.AlignmentFlag.AlignRight)
-        arrival_font = QFont()
-        arrival_font.setPointSize(18)
-        self.arrival_info.setFont(arrival_font)
+        self.arrival_info.setFont(info_font)
         location_layout.addWidget(self.arrival_info)
         
         # Set size policy to allow expansion
@@ -90,44 +90,35 @@ class LocationInfoSection(BaseTrainComponent):
         if not self.train_data or not hasattr(self, 'location_info'):
             return
         
-        # Update location info
+        # Heartbeat updates rarely change these two fields; skip the reflow
+        key = (self.train_data.current_location, self.train_data.estimated_arrival)
+        if key == self._last_loc_key:
+            return
+        self._last_loc_key = key
+        
+        location_text = ""
         if self.train_data.current_location:
             location_text = f"Current: {self.train_data.current_location} 📍"
-            self.location_info.setText(location_text)
-            self.location_info.setVisible(True)
-        else:
-            self.location_info.setVisible(False)
-        
-        # Update arrival info
+        arrival_text = ""
         if self.train_data.estimated_arrival:
-            arrival_text = f"Arrives: {self.train_data.format_arrival_time()} 🏁"
-            self.arrival_info.setText(arrival_text)
-            self.arrival_info.setVisible(True)
-        else:
-            self.arrival_info.setVisible(False)
+            arrival_text = f"Arrives: {self.train_data.formatted_arrival_time} 🏁"
+        
+        # Suspend painting so both labels update in one pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_label_text(self.location_info, location_text)
+            self._set_label_text(self.arrival_info, arrival_text)
+        finally:
+            self.setUpdatesEnabled(True)
+    
+    @staticmethod
+    def _set_label_text(label: QLabel, text: str) -> None:
+        """Show a label with the given text, or hide it when the text is empty."""
+        if text:
+            label.setText(text)
+        label.setVisible(bool(text))
     
     def _apply_theme_styles(self) -> None:
         """Apply theme-specific styling."""
-        colors = self.get_theme_colors(self._current_theme)
-        
-        # Apply theme-specific styles
-        if self._current_theme == "light":
-            self.setStyleSheet(f"""
-                QLabel {{
-                    color: #212121;
-                    background-color: transparent;
-                    border: none;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QLabel {{
-                    color: {colors['text_primary']};
-                    background-color: transparent;
-                    border: none;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-            """)
\ No newline at end of file
+        # Shared per theme, so every row hands Qt the same string
+        self.setStyleSheet(self.get_label_stylesheet())
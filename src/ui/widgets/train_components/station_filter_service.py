@@ -7,17 +7,112 @@ for train displays, including identifying major stations and interchanges.
 
 import json
 import logging
-import os
-from typing import List, Set, Dict, Optional
+import re
+import sys
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, List, Set, Dict, Mapping, Optional, Tuple
+
+try:  # Optional speed-up: orjson parses the config files several times faster.
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    _orjson = None
 
 from PySide6.QtWidgets import QWidget
 from .base_component import BaseTrainComponent
 from ....ui.formatters.underground_formatter import UndergroundFormatter
 from ....models.train_data import CallingPoint
+from .station_names import UNDERGROUND_MARKER_PREFIX, is_html_station_name
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# London terminus stations
+_LONDON_TERMINUS_STATIONS = frozenset({
+    "London Paddington", "London Liverpool Street", "London Waterloo",
+    "London Victoria", "London Bridge", "London Euston",
+    "London Kings Cross", "London St Pancras", "London Marylebone",
+    "London Charing Cross", "London Cannon Street", "London Blackfriars",
+    "London Fenchurch Street",
+})
+# Names that merely contain a terminus (e.g. "London Waterloo East") also
+# count; one compiled alternation replaces a substring scan per terminus.
+_LONDON_TERMINUS_RE = re.compile("|".join(map(re.escape, sorted(_LONDON_TERMINUS_STATIONS))))
+
+# Station configuration files (src/data), resolved once at import
+_DATA_DIR = Path(__file__).parents[3] / "data"
+
+
+def _load_config_json(file_name: str) -> Any:
+    """Parse a config file from its raw bytes (no text-decoding wrapper)."""
+    raw = (_DATA_DIR / file_name).read_bytes()
+    if _orjson is not None:
+        return _orjson.loads(raw)
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=1)
+def _read_major_stations() -> frozenset:
+    """
+    Read major stations from configuration file.
+    
+    Cached: every train row builds a StationFilterService, and the file
+    does not change while the app runs. Errors propagate, so a failed read
+    is not cached and the next call retries it.
+    
+    Returns:
+        Frozen set of interned major station names
+    """
+    data = _load_config_json("major_stations.json")
+    # Interned like CallingPoint.station_name, so membership tests for
+    # ingested names hit the identity fast path instead of comparing text
+    return frozenset(map(sys.intern, data.get('major_stations', [])))
+
+
+def _load_major_stations() -> frozenset:
+    """
+    Load major stations from configuration file.
+    
+    Returns:
+        Frozen set of interned major station names
+    """
+    try:
+        return _read_major_stations()
+    except Exception as e:
+        logger.error(f"Error loading major stations: {e}")
+        # Fallback to empty set if file can't be loaded
+        return frozenset()
+
+
+@lru_cache(maxsize=1)
+def _read_underground_system_indicators() -> Mapping[str, Any]:
+    """
+    Read underground system indicators from configuration file.
+    
+    Cached like _read_major_stations(); the shared mapping is read-only.
+    
+    Returns:
+        Read-only mapping of underground system indicators
+    """
+    data = _load_config_json("underground_systems.json")
+    return MappingProxyType(data.get('system_indicators', {}))
+
+
+def _load_underground_system_indicators() -> Mapping[str, Any]:
+    """
+    Load underground system indicators from configuration file.
+    
+    Returns:
+        Read-only mapping of underground system indicators
+    """
+    try:
+        return _read_underground_system_indicators()
+    except Exception as e:
+        logger.error(f"Error loading underground system indicators: {e}")
+        # Fallback to empty mapping if file can't be loaded
+        return MappingProxyType({})
+
 
 class StationFilterService(BaseTrainComponent):
     """
@@ -27,24 +122,34 @@ class StationFilterService(BaseTrainComponent):
     and detect interchange stations.
     """
     
-    def __init__(self, train_data=None, parent: Optional[QWidget] = None):
+    def __init__(self, train_data=None, parent: Optional[QWidget] = None,
+                 underground_formatter=None):
         """
         Initialize station filter service.
         
         Args:
             train_data: Train data to process
             parent: Parent widget
+            underground_formatter: Optional formatter (or cached lookup) shared
+                with the owning component
         """
         super().__init__(parent)
         
         self.train_data = train_data
+        # Interned names of user interchanges, built lazily per train
+        self._interchange_names: Optional[frozenset] = None
+        # (has_underground, system_info), built lazily per train; see
+        # _underground_system_info()
+        self._underground_info: Optional[Tuple[bool, dict]] = None
+        # "Use Underground" row shared by every terminus of the current train
+        self._underground_indicator: Optional[CallingPoint] = None
         
         # Initialize Underground formatter for black box routing
-        self.underground_formatter = UndergroundFormatter()
+        self.underground_formatter = underground_formatter or UndergroundFormatter()
         
-        # Load configuration files
-        self.major_stations = self._load_major_stations()
-        self.underground_system_indicators = self._load_underground_system_indicators()
+        # Configuration files are parsed once per process and shared
+        self.major_stations = _load_major_stations()
+        self.underground_system_indicators = _load_underground_system_indicators()
     
     def set_train_data(self, train_data):
         """
@@ -53,47 +158,114 @@ class StationFilterService(BaseTrainComponent):
         Args:
             train_data: Train data to process
         """
+        if train_data is not self.train_data:
+            self._interchange_names = None
+            self._underground_info = None
+            self._underground_indicator = None
         self.train_data = train_data
     
-    def _load_major_stations(self) -> set:
+    def _journey_interchange_names(self) -> frozenset:
         """
-        Load major stations from configuration file.
+        Return the stations where the user changes trains, computed once per train.
+        
+        Two-step logic:
+        STEP 1: IF user changes lines → Mark as interchange
+        STEP 2: IF user changes lines BUT stays on same physical train → Not an interchange
         
         Returns:
-            Set of major station names
+            Interned, stripped station names that are actual interchanges
         """
-        try:
-            # Get the path to the data directory
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'data')
-            file_path = os.path.join(data_dir, 'major_stations.json')
+        if self._interchange_names is not None:
+            return self._interchange_names
+        
+        segments = getattr(self.train_data, 'route_segments', None) or []
+        line_changes = set()
+        same_train = set()
+        
+        # Look for consecutive segments that connect at the same station
+        for current_segment, next_segment in zip(segments, segments[1:]):
+            # Station and line names are required RouteSegment fields; read
+            # them directly and skip any malformed pair as a whole
+            try:
+                current_to = current_segment.to_station.strip()
+                next_from = next_segment.from_station.strip()
+                if current_to != next_from:
+                    continue
+                
+                # This station connects segments - check for line change
+                if current_segment.line_name == next_segment.line_name:
+                    continue
+            except AttributeError:
+                continue
+            station = sys.intern(current_to)
+            line_changes.add(station)
             
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                return set(data.get('major_stations', []))
-        except Exception as e:
-            logger.error(f"Error loading major stations: {e}")
-            # Fallback to empty set if file can't be loaded
-            return set()
+            # Check if it's the same physical train despite line change;
+            # train_id is optional, so it keeps the getattr default
+            current_train_id = getattr(current_segment, 'train_id', None)
+            next_train_id = getattr(next_segment, 'train_id', None)
+            if current_train_id and next_train_id and current_train_id == next_train_id:
+                same_train.add(station)
+        
+        self._interchange_names = frozenset(line_changes - same_train)
+        return self._interchange_names
     
-    def _load_underground_system_indicators(self) -> dict:
+    def _underground_system_info(self) -> Tuple[bool, dict]:
         """
-        Load underground system indicators from configuration file.
+        Return whether the train has an Underground segment, and its system info.
+        
+        Computed once per train instead of rescanning the route segments for
+        every calling point.
         
         Returns:
-            Dictionary of underground system indicators
+            (has_underground, system info of the first Underground segment)
         """
-        try:
-            # Get the path to the data directory
-            data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))), 'data')
-            file_path = os.path.join(data_dir, 'underground_systems.json')
+        if self._underground_info is not None:
+            return self._underground_info
+        
+        self._underground_info = (False, {})
+        for segment in getattr(self.train_data, 'route_segments', None) or []:
+            if self.underground_formatter.is_underground_segment(segment):
+                system_info = self.underground_formatter.get_underground_system_info(segment)
+                self._underground_info = (True, system_info)
+                break
+        return self._underground_info
+    
+    def _underground_indicator_for(self, system_info: dict) -> CallingPoint:
+        """
+        Return the Underground indicator row shown after London termini.
+        
+        CallingPoint is immutable, so one instance per train is built and
+        appended after every terminus rather than a fresh one per match.
+        
+        Args:
+            system_info: System info of the train's first Underground segment
             
-            with open(file_path, 'r') as f:
-                data = json.load(f)
-                return data.get('system_indicators', {})
-        except Exception as e:
-            logger.error(f"Error loading underground system indicators: {e}")
-            # Fallback to empty dict if file can't be loaded
-            return {}
+        Returns:
+            Indicator calling point for the system
+        """
+        if self._underground_indicator is not None:
+            return self._underground_indicator
+        
+        # Create a dummy datetime for the required parameters
+        now = datetime.now()
+        
+        # System-specific information (first Underground segment)
+        system_name = system_info.get("short_name", "Underground")
+        time_range = system_info.get("time_range", "10-40min")
+        emoji = system_info.get("emoji", "🚇")
+        
+        self._underground_indicator = CallingPoint(
+            station_name=f"{UNDERGROUND_MARKER_PREFIX}>{emoji} Use {system_name} ({time_range})</font>",
+            scheduled_arrival=now,
+            scheduled_departure=now,
+            expected_arrival=now,
+            expected_departure=now,
+            platform="",
+            is_origin=False,
+            is_destination=False
+        )
+        return self._underground_indicator
     
     def filter_calling_points(self, calling_points: List[CallingPoint]) -> List[CallingPoint]:
         """
@@ -105,23 +277,25 @@ class StationFilterService(BaseTrainComponent):
         Returns:
             Filtered list of calling points
         """
-        seen_stations = set()
+        # Stripped station name -> index of its entry in filtered_calling_points
+        index_by_name: Dict[str, int] = {}
         filtered_calling_points = []
         
         for calling_point in calling_points:
             station_name = calling_point.station_name.strip() if calling_point.station_name else ""
-            if station_name not in seen_stations:
-                seen_stations.add(station_name)
+            j = index_by_name.get(station_name)
+            if j is None:
+                index_by_name[station_name] = len(filtered_calling_points)
                 filtered_calling_points.append(calling_point)
-            else:
-                # If we've seen this station before, check if this one is more important
-                for j, existing_cp in enumerate(filtered_calling_points):
-                    if existing_cp.station_name == station_name:
-                        # Prefer origin/destination over intermediate, or one with platform info
-                        if (calling_point.is_origin or calling_point.is_destination or
-                            (calling_point.platform and not existing_cp.platform)):
-                            filtered_calling_points[j] = calling_point
-                        break
+                continue
+            
+            # If we've seen this station before, check if this one is more important
+            existing_cp = filtered_calling_points[j]
+            if existing_cp.station_name == station_name:
+                # Prefer origin/destination over intermediate, or one with platform info
+                if (calling_point.is_origin or calling_point.is_destination or
+                    (calling_point.platform and not existing_cp.platform)):
+                    filtered_calling_points[j] = calling_point
         
         return filtered_calling_points
     
@@ -136,30 +310,32 @@ class StationFilterService(BaseTrainComponent):
         Returns:
             Filtered list of essential calling points
         """
-        if not self.train_data:
+        # Nothing to classify: skip the setup below
+        if not self.train_data or not calling_points:
             return calling_points
             
         essential_calling_points = []
         
-        # Always include origin and destination
+        # Always include origin and destination; they are picked out in the
+        # same pass that classifies the stations in between
         origin = None
         destination = None
         
-        # Find origin and destination
-        for cp in calling_points:
-            if cp.is_origin:
-                origin = cp
-            elif cp.is_destination:
-                destination = cp
-        
-        # Add origin if found
-        if origin:
-            essential_calling_points.append(origin)
+        # Loop invariants: interchange checks need route segments, and the
+        # terminus branch an Underground segment (scanned once per train)
+        has_route_segments = bool(getattr(self.train_data, 'route_segments', None))
+        has_underground, system_info = (
+            self._underground_system_info() if has_route_segments else (False, {})
+        )
         
         # Include interchange stations and major stations
         for calling_point in calling_points:
-            if calling_point.is_origin or calling_point.is_destination:
-                continue  # Already handled
+            if calling_point.is_origin:
+                origin = calling_point
+                continue
+            if calling_point.is_destination:
+                destination = calling_point
+                continue
                 
             station_name = calling_point.station_name.strip() if calling_point.station_name else ""
             
@@ -168,71 +344,33 @@ class StationFilterService(BaseTrainComponent):
                 essential_calling_points.append(calling_point)
                 continue
                 
-            # Include interchange stations (where user changes trains)
-            if self.is_actual_user_journey_interchange(station_name):
+            # Include interchange stations (where user changes trains); the
+            # guards are hoisted and the interchange key is memoised per name
+            if has_route_segments and self._is_interchange_clean(self._interchange_key(station_name)):
                 essential_calling_points.append(calling_point)
                 continue
                 
             # Include major stations
-            if self.is_major_station(station_name):
+            if self._is_major_station_clean(station_name):
                 essential_calling_points.append(calling_point)
                 continue
                 
             # Include London terminus stations if we have underground segments
-            if hasattr(self.train_data, 'route_segments') and self.train_data.route_segments:
-                # Check if we have any underground segments
-                has_underground = False
-                for segment in self.train_data.route_segments:
-                    if self.underground_formatter.is_underground_segment(segment):
-                        has_underground = True
-                        break
+            if has_underground and (station_name in _LONDON_TERMINUS_STATIONS
+                                    or _LONDON_TERMINUS_RE.search(station_name)):
+                essential_calling_points.append(calling_point)
                 
-                if has_underground:
-                    # List of London terminus stations
-                    london_terminus_stations = [
-                        "London Paddington", "London Liverpool Street", "London Waterloo",
-                        "London Victoria", "London Bridge", "London Euston",
-                        "London Kings Cross", "London St Pancras", "London Marylebone",
-                        "London Charing Cross", "London Cannon Street", "London Blackfriars",
-                        "London Fenchurch Street"
-                    ]
-                    
-                    # Check if this is a London terminus station
-                    if any(terminus in station_name for terminus in london_terminus_stations):
-                        essential_calling_points.append(calling_point)
-                        
-                        # Add underground indicator after this terminus station
-                        # Create a dummy datetime for the required parameters
-                        now = datetime.now()
-                        
-                        # Get system-specific information
-                        system_info = {}
-                        for segment in self.train_data.route_segments:
-                            if self.underground_formatter.is_underground_segment(segment):
-                                system_info = self.underground_formatter.get_underground_system_info(segment)
-                                break
-                                
-                        system_name = system_info.get("short_name", "Underground")
-                        time_range = system_info.get("time_range", "10-40min")
-                        emoji = system_info.get("emoji", "🚇")
-                        
-                        # Create underground indicator
-                        underground_indicator = CallingPoint(
-                            station_name=f"<font color='#DC241F'>{emoji} Use {system_name} ({time_range})</font>",
-                            scheduled_arrival=now,
-                            scheduled_departure=now,
-                            expected_arrival=now,
-                            expected_departure=now,
-                            platform="",
-                            is_origin=False,
-                            is_destination=False
-                        )
-                        
-                        # Add underground indicator after this terminus station
-                        essential_calling_points.append(underground_indicator)
-        
-        # Add destination if found and not already in the list
-        if destination and destination not in essential_calling_points:
+                # Add underground indicator after this terminus station
+                essential_calling_points.append(self._underground_indicator_for(system_info))
+        
+        # Add origin first if found
+        if origin:
+            essential_calling_points.insert(0, origin)
+        
+        # Add destination if found. It cannot already be in the list: the loop
+        # above skips origin/destination points, and the origin differs from
+        # it in is_origin, so no equality scan over the list is needed.
+        if destination is not None:
             essential_calling_points.append(destination)
         
         return essential_calling_points
@@ -248,7 +386,7 @@ class StationFilterService(BaseTrainComponent):
             True if the station is a major station, False otherwise
         """
         # Check if this is an HTML-formatted station name
-        is_html_formatted = "<font" in station_name and "</font>" in station_name
+        is_html_formatted = is_html_station_name(station_name)
         
         # Process station name based on whether it's HTML-formatted
         if is_html_formatted:
@@ -259,8 +397,12 @@ class StationFilterService(BaseTrainComponent):
             # Trim any leading and trailing spaces from the station name
             processed_name = station_name.strip() if station_name else ""
         
+        return self._is_major_station_clean(processed_name)
+    
+    def _is_major_station_clean(self, station_name: str) -> bool:
+        """Major-station check for a name the caller has already cleaned."""
         # Use the loaded major stations list from configuration file
-        return processed_name in self.major_stations
+        return station_name in self.major_stations
     
     def is_actual_user_journey_interchange(self, station_name: str) -> bool:
         """
@@ -279,51 +421,53 @@ class StationFilterService(BaseTrainComponent):
         if not self.train_data:
             return False
             
-        # Check if this is an HTML-formatted station name
-        is_html_formatted = "<font" in station_name and "</font>" in station_name
-        
-        # Process station name based on whether it's HTML-formatted
-        if is_html_formatted:
-            # For HTML-formatted names, we need to be careful with replacements
-            # This is a simplified approach - a more robust solution would use HTML parsing
-            clean_name = station_name.replace(" (Cross Country Line)", "")
-        else:
-            clean_name = station_name.replace(" (Cross Country Line)", "").strip()
-        
         # Check if we have route segments to analyze
         if not hasattr(self.train_data, 'route_segments') or not self.train_data.route_segments:
             return False
         
-        # STEP 1: Check if user changes lines at this station
-        line_change_detected = False
-        same_physical_train = False
+        return self._is_interchange_clean(self._interchange_key(station_name))
+    
+    def _is_interchange_clean(self, clean_name: str) -> bool:
+        """Interchange check for a name already run through _interchange_key()."""
+        # Segment connections are indexed once per train rather than rescanned
+        # for every station
+        return clean_name in self._journey_interchange_names()
+    
+    def user_interchange_flags(self, calling_points: List[CallingPoint]) -> List[bool]:
+        """
+        Flag which calling points are actual user interchanges, in one pass.
         
-        # Look for consecutive segments that connect at this station
-        for i in range(len(self.train_data.route_segments) - 1):
-            current_segment = self.train_data.route_segments[i]
-            next_segment = self.train_data.route_segments[i + 1]
-            
-            # Check if this station connects two segments
-            current_to = getattr(current_segment, 'to_station', '').strip()
-            next_from = getattr(next_segment, 'from_station', '').strip()
+        Equivalent to calling is_actual_user_journey_interchange() for each
+        station, with the per-call guards hoisted out of the loop.
+        
+        Args:
+            calling_points: Calling points about to be displayed
             
-            if current_to == clean_name and next_from == clean_name:
-                # This station connects segments - check for line change
-                current_line = getattr(current_segment, 'line_name', '')
-                next_line = getattr(next_segment, 'line_name', '')
-                
-                if current_line != next_line:
-                    line_change_detected = True
-                    
-                    # STEP 2: Check if it's the same physical train despite line change
-                    current_train_id = getattr(current_segment, 'train_id', None)
-                    next_train_id = getattr(next_segment, 'train_id', None)
-                    
-                    if current_train_id and next_train_id and current_train_id == next_train_id:
-                        same_physical_train = True
-        
-        # Return True only if there's a line change AND it's not the same physical train
-        return line_change_detected and not same_physical_train
+        Returns:
+            One flag per calling point, in order
+        """
+        if not self.train_data or not getattr(self.train_data, 'route_segments', None):
+            return [False] * len(calling_points)
+        
+        interchanges = self._journey_interchange_names()
+        interchange_key = self._interchange_key
+        return [interchange_key(cp.station_name or "") in interchanges for cp in calling_points]
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _interchange_key(station_name: str) -> str:
+        """
+        Return the name used to look a station up in the interchange index.
+        
+        Memoised: the same station names recur on every row and refresh, so
+        each is sanitised once.
+        """
+        clean_name = station_name.replace(" (Cross Country Line)", "")
+        # HTML-formatted names keep their markup untouched; plain names are
+        # trimmed. A more robust solution for HTML would use HTML parsing.
+        if is_html_station_name(station_name):
+            return clean_name
+        return clean_name.strip()
     
     def get_underground_system_for_station(self, station_name: str) -> Optional[str]:
         """
@@ -336,7 +480,8 @@ class StationFilterService(BaseTrainComponent):
             Underground system name or None if not an underground station
         """
         # This is a placeholder for future implementation
-        # Currently, underground stations are identified by HTML formatting
-        if "<font color='#DC241F'" in station_name:
+        # Currently, underground stations are identified by HTML formatting;
+        # the marker is always the leading tag, so a prefix check suffices
+        if station_name.startswith(UNDERGROUND_MARKER_PREFIX):
             return "Underground"
         return None
@@ -0,0 +1,48 @@
+"""Station-name helpers shared by the calling-points components.
+
+Calling points carry either plain station names or HTML markers (walking and
+Underground indicators) that are always emitted as a leading `<font ...>` tag.
+"""
+
+from __future__ import annotations
+
+import sys
+from functools import lru_cache
+from typing import Tuple
+
+
+def is_html_station_name(text: str) -> bool:
+    """Return True for an HTML-formatted station marker.
+
+    Plain station names are rejected on the first character without scanning
+    the whole string; the closing tag is only checked when the prefix matches.
+    """
+
+    return text.startswith("<font") and "</font>" in text
+
+
+# Leading tag of walking-connection markers (see train_data_components.walking_display)
+WALKING_MARKER_PREFIX = "<font color='#f44336'"
+
+# Leading tag of Underground indicators (see StationFilterService)
+UNDERGROUND_MARKER_PREFIX = "<font color='#DC241F'"
+
+
+def station_name_markers(text: str) -> Tuple[bool, bool]:
+    """Return `(is_html, is_walking)` for a station name in one pass.
+
+    Both markers are leading-tag checks, so plain names cost a single
+    `startswith`; the walking colour is only tested on HTML names. (Prefix
+    checks beat a compiled regex here: names are short and mostly plain.)
+    """
+
+    if not is_html_station_name(text):
+        return False, False
+    return True, text.startswith(WALKING_MARKER_PREFIX)
+
+
+@lru_cache(maxsize=1024)
+def normalized_station_name(raw: str) -> str:
+    """Return `raw` unchanged for HTML markers, otherwise stripped and interned."""
+
+    return raw if is_html_station_name(raw) else sys.intern(raw.strip())
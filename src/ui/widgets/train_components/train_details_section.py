@@ -6,13 +6,13 @@ including operator and status.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional
 
 from PySide6.QtWidgets import (
     QHBoxLayout, QLabel, QSizePolicy
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
 
 from .base_component import BaseTrainComponent
 from ....models.train_data import TrainData
@@ -41,6 +41,9 @@ class TrainDetailsSection(BaseTrainComponent):
         self.train_data = train_data
         self._current_theme = theme
         self._theme_colors = self.get_theme_colors(theme)
+        # Texts last set on each label; None before the first update
+        self._last_operator_text: Optional[str] = None
+        self._last_status_text: Optional[str] = None
         
         # Setup UI
         self._setup_ui()
@@ -64,9 +67,7 @@ class TrainDetailsSection(BaseTrainComponent):
         
         # Left: Operator and service details
         self.operator_info = QLabel()
-        operator_font = QFont()
-        operator_font.setPointSize(20)
-        self.operator_info.setFont(operator_font)
+        self.operator_info.setFont(self.get_font(20))
         details_layout.addWidget(self.operator_info)
         
         details_layout.addStretch()
@@ -74,10 +75,7 @@ class TrainDetailsSection(BaseTrainComponent):
         # Right: Status with icon
         self.status_info = QLabel()
         self.status_info.setAlignment(Qt.AlignmentFlag.AlignRight)
-        status_font = QFont()
-        status_font.setPointSize(20)
-        status_font.setBold(True)
-        self.status_info.setFont(status_font)
+        self.status_info.setFont(self.get_font(20, bold=True))
         details_layout.addWidget(self.status_info)
         
         # Set size policy to allow expansion
@@ -91,40 +89,37 @@ class TrainDetailsSection(BaseTrainComponent):
         if not self.train_data or not hasattr(self, 'operator_info'):
             return
         
-        # Update operator info
+        # Update operator info; idle refreshes leave unchanged labels alone
         operator_text = self.train_data.operator or "Unknown Operator"
-        self.operator_info.setText(operator_text)
+        if operator_text != self._last_operator_text:
+            self._last_operator_text = operator_text
+            self.operator_info.setText(operator_text)
         
         # Update status info
         status_text = f"{self.train_data.get_status_icon()} {self.train_data.format_delay()}"
-        self.status_info.setText(status_text)
+        if status_text != self._last_status_text:
+            self._last_status_text = status_text
+            self.status_info.setText(status_text)
         
-        # Set status color
-        status_color = self.train_data.get_status_color(self._current_theme)
-        self.status_info.setStyleSheet(f"color: {status_color};")
+        # Set status color: matched by the section stylesheet's [trainStatus]
+        # rules, so only re-polish when the status actually changes
+        status = self.train_data.status.value
+        if self.status_info.property("trainStatus") != status:
+            self.status_info.setProperty("trainStatus", status)
+            style = self.status_info.style()
+            style.unpolish(self.status_info)
+            style.polish(self.status_info)
     
     def _apply_theme_styles(self) -> None:
         """Apply theme-specific styling."""
-        colors = self.get_theme_colors(self._current_theme)
-        
-        # Apply theme-specific styles
-        if self._current_theme == "light":
-            self.setStyleSheet(f"""
-                QLabel {{
-                    color: #212121;
-                    background-color: transparent;
-                    border: none;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QLabel {{
-                    color: {colors['text_primary']};
-                    background-color: transparent;
-                    border: none;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-            """)
\ No newline at end of file
+        # Shared per theme, so every row hands Qt the same string
+        self.setStyleSheet(_details_stylesheet(self.get_label_stylesheet(), self._current_theme))
+
+
+@lru_cache(maxsize=8)
+def _details_stylesheet(label_stylesheet: str, theme: str) -> str:
+    """Return the label stylesheet followed by the per-status colour rules."""
+    return label_stylesheet + "".join(
+        f'QLabel[trainStatus="{status.value}"] {{ color: {color}; }}\n'
+        for status, color in TrainData.status_colors(theme).items()
+    )
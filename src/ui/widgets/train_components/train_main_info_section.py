@@ -12,7 +12,6 @@ from PySide6.QtWidgets import (
     QHBoxLayout, QLabel, QSizePolicy, QLayout
 )
 from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
 
 from .base_component import BaseTrainComponent
 from ....models.train_data import TrainData
@@ -44,6 +43,10 @@ class TrainMainInfoSection(BaseTrainComponent):
         self.train_data = train_data
         self._current_theme = theme
         self._theme_colors = self.get_theme_colors(theme)
+        # Texts last set on each label; None before the first update
+        self._last_time_text: Optional[str] = None
+        self._last_destination_text: Optional[str] = None
+        self._last_platform_text: Optional[str] = None
         
         # Setup UI first, which will initialize the UI elements
         self._setup_ui()
@@ -72,17 +75,12 @@ class TrainMainInfoSection(BaseTrainComponent):
         
         # Train service icon and time
         self.time_info = QLabel()
-        time_font = QFont()
-        time_font.setPointSize(28)
-        time_font.setBold(True)
-        self.time_info.setFont(time_font)
+        self.time_info.setFont(self.get_font(28, bold=True))
         left_layout.addWidget(self.time_info)
         
         # Arrow and destination
         self.destination_info = QLabel()
-        dest_font = QFont()
-        dest_font.setPointSize(24)
-        self.destination_info.setFont(dest_font)
+        self.destination_info.setFont(self.get_font(24))
         left_layout.addWidget(self.destination_info)
         
         left_layout.addStretch()
@@ -94,18 +92,13 @@ class TrainMainInfoSection(BaseTrainComponent):
         # Platform info
         self.platform_info = QLabel()
         self.platform_info.setAlignment(Qt.AlignmentFlag.AlignRight)
-        platform_font = QFont()
-        platform_font.setPointSize(20)
-        self.platform_info.setFont(platform_font)
+        self.platform_info.setFont(self.get_font(20))
         right_layout.addWidget(self.platform_info)
         
         # Details button
         self.details_button = QLabel("🗺️ Route")
         self.details_button.setAlignment(Qt.AlignmentFlag.AlignRight)
-        details_font = QFont()
-        details_font.setPointSize(20)
-        details_font.setBold(True)
-        self.details_button.setFont(details_font)
+        self.details_button.setFont(self.get_font(20, bold=True))
         self._style_details_button()
         right_layout.addWidget(self.details_button)
         
@@ -123,17 +116,23 @@ class TrainMainInfoSection(BaseTrainComponent):
         if not self.train_data or not hasattr(self, 'time_info'):
             return
         
-        # Update time info
+        # Update time info; idle refreshes leave unchanged labels alone
         time_text = f"{self.train_data.get_service_icon()} {self.train_data.format_departure_time()}"
-        self.time_info.setText(time_text)
+        if time_text != self._last_time_text:
+            self._last_time_text = time_text
+            self.time_info.setText(time_text)
         
         # Update destination
-        destination_text = self.train_data.destination or "Unknown"
-        self.destination_info.setText(f"→ {destination_text}")
+        destination_text = f"→ {self.train_data.destination or 'Unknown'}"
+        if destination_text != self._last_destination_text:
+            self._last_destination_text = destination_text
+            self.destination_info.setText(destination_text)
         
         # Update platform
         platform_text = f"Platform {self.train_data.platform or 'TBA'}"
-        self.platform_info.setText(platform_text)
+        if platform_text != self._last_platform_text:
+            self._last_platform_text = platform_text
+            self.platform_info.setText(platform_text)
     
     def _style_details_button(self) -> None:
         """Style the details button."""
@@ -154,35 +153,14 @@ class TrainMainInfoSection(BaseTrainComponent):
     
     def _apply_theme_styles(self) -> None:
         """Apply theme-specific styling."""
-        colors = self.get_theme_colors(self._current_theme)
-        
-        # Apply theme-specific styles
-        if self._current_theme == "light":
-            self.setStyleSheet(f"""
-                QLabel {{
-                    color: #212121;
-                    background-color: transparent;
-                    border: none;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-            """)
-        else:
-            self.setStyleSheet(f"""
-                QLabel {{
-                    color: {colors['text_primary']};
-                    background-color: transparent;
-                    border: none;
-                    margin: 0px;
-                    padding: 0px;
-                }}
-            """)
+        # Shared per theme, so every row hands Qt the same string
+        self.setStyleSheet(self.get_label_stylesheet())
     
     def mousePressEvent(self, event):
         """Handle mouse press event."""
         if event.button() == Qt.MouseButton.LeftButton:
             # Only handle clicks on the Route button
-            if self.details_button and self.details_button.geometry().contains(event.pos()):
+            if self.details_button and self.details_button.geometry().contains(event.position().toPoint()):
                 if self.train_data:
                     self.route_clicked.emit(self.train_data)
         super().mousePressEvent(event)
\ No newline at end of file
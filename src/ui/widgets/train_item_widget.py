@@ -6,12 +6,13 @@ including departure time, destination, platform, operator, status, and current l
 """
 
 import logging
-from typing import Optional
+import sys
+from typing import Dict, Optional, Tuple
 
 from PySide6.QtWidgets import (
     QFrame, QVBoxLayout, QWidget
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, Slot
 
 from ...models.train_data import TrainData
 from .train_widgets_base import BaseTrainWidget
@@ -24,6 +25,72 @@ from .train_components import (
 
 logger = logging.getLogger(__name__)
 
+# Item stylesheet templates, formatted by TrainItemWidget._build_stylesheet()
+# with the theme palette plus the row's status_color
+_LIGHT_STYLE_TMPL = """
+            QFrame {{
+                background-color: #ffffff !important;
+                border: 1px solid #e0e0e0 !important;
+                border-left: 4px solid {status_color} !important;
+                border-radius: 8px !important;
+                margin: 2px !important;
+                padding: 8px !important;
+            }}
+            
+            QFrame:hover {{
+                background-color: #f5f5f5 !important;
+                border-color: #1976d2 !important;
+            }}
+            
+            QLabel {{
+                color: #212121 !important;
+                background-color: transparent !important;
+                border: none !important;
+                margin: 0px !important;
+                padding: 0px !important;
+                font-size: 15pt !important;
+                text-align: left !important;
+                max-width: 100000px !important;
+                min-width: 0px !important;
+            }}
+            
+            QWidget {{
+                background-color: transparent !important;
+            }}
+            """
+
+_DARK_STYLE_TMPL = """
+            QFrame {{
+                background-color: {background_secondary};
+                border: 1px solid {border_primary};
+                border-left: 4px solid {status_color};
+                border-radius: 8px;
+                margin: 2px;
+                padding: 8px;
+            }}
+            
+            QFrame:hover {{
+                background-color: {background_hover};
+                border-color: {primary_accent};
+            }}
+            
+            QLabel {{
+                color: {text_primary};
+                background-color: transparent;
+                border: none;
+                margin: 0px;
+                padding: 0px;
+                font-size: 15pt;
+                text-align: left;
+                max-width: 100000px;
+                min-width: 0px;
+            }}
+            
+            QWidget {{
+                background-color: transparent;
+            }}
+            """
+
 
 class TrainItemWidget(BaseTrainWidget):
     """
@@ -41,8 +108,13 @@ class TrainItemWidget(BaseTrainWidget):
     # Signal emitted when route button is clicked
     route_clicked = Signal(TrainData)
 
+    # (theme, status colour) -> stylesheet, shared by every train item. The
+    # palettes are fixed per theme, so entries never go stale.
+    _STYLE_CACHE: Dict[Tuple[str, str], str] = {}
+
     def __init__(self, train_data: TrainData, theme: str = "dark",
-                 train_manager=None, preferences: Optional[dict] = None, parent: Optional[QWidget] = None):
+                 train_manager=None, preferences: Optional[dict] = None, parent: Optional[QWidget] = None,
+                 underground_formatter=None):
         """
         Initialize train item widget.
 
@@ -52,15 +124,19 @@ class TrainItemWidget(BaseTrainWidget):
             train_manager: Train manager instance for accessing route data
             preferences: User preferences dictionary
             parent: Parent widget
+            underground_formatter: Optional Underground formatter shared between
+                train items (see TrainListWidget)
         """
         super().__init__(parent)
         
-        # Initialize theme
-        self.current_theme = theme
+        # Initialize theme; interned so every row shares one string, which
+        # also keys the shared stylesheet cache
+        self.current_theme = sys.intern(theme)
         
         self.train_data = train_data
         self.train_manager = train_manager
         self.preferences = preferences or {}
+        self.underground_formatter = underground_formatter
         
         # Setup UI
         self._setup_ui()
@@ -82,13 +158,17 @@ class TrainItemWidget(BaseTrainWidget):
         layout.addWidget(self.details_section)
         
         # Calling points section (intermediate stations)
-        self.calling_points_manager = CallingPointsManager(self.train_data, self.current_theme, self)
+        self.calling_points_manager = CallingPointsManager(
+            self.train_data, self.current_theme, self,
+            underground_formatter=self.underground_formatter
+        )
         layout.addWidget(self.calling_points_manager)
         
         # Location section (current location and arrival time)
         self.location_section = LocationInfoSection(self.train_data, self.current_theme, self)
         layout.addWidget(self.location_section)
     
+    @Slot(TrainData)
     def _on_route_clicked(self, train_data: TrainData) -> None:
         """
         Handle route button click.
@@ -111,75 +191,14 @@ class TrainItemWidget(BaseTrainWidget):
     
     def _apply_theme_styles(self) -> None:
         """Apply theme-specific styling."""
-        colors = self.get_theme_colors(self.current_theme)
         status_color = self.train_data.get_status_color(self.current_theme)
 
-        # FORCE light theme styling when in light mode
-        if self.current_theme == "light":
-            style = f"""
-            QFrame {{
-                background-color: #ffffff !important;
-                border: 1px solid #e0e0e0 !important;
-                border-left: 4px solid {status_color} !important;
-                border-radius: 8px !important;
-                margin: 2px !important;
-                padding: 8px !important;
-            }}
-            
-            QFrame:hover {{
-                background-color: #f5f5f5 !important;
-                border-color: #1976d2 !important;
-            }}
-            
-            QLabel {{
-                color: #212121 !important;
-                background-color: transparent !important;
-                border: none !important;
-                margin: 0px !important;
-                padding: 0px !important;
-                font-size: 15pt !important;
-                text-align: left !important;
-                max-width: 100000px !important;
-                min-width: 0px !important;
-            }}
-            
-            QWidget {{
-                background-color: transparent !important;
-            }}
-            """
-        else:
-            # Dark theme styling
-            style = f"""
-            QFrame {{
-                background-color: {colors['background_secondary']};
-                border: 1px solid {colors['border_primary']};
-                border-left: 4px solid {status_color};
-                border-radius: 8px;
-                margin: 2px;
-                padding: 8px;
-            }}
-            
-            QFrame:hover {{
-                background-color: {colors['background_hover']};
-                border-color: {colors['primary_accent']};
-            }}
-            
-            QLabel {{
-                color: {colors['text_primary']};
-                background-color: transparent;
-                border: none;
-                margin: 0px;
-                padding: 0px;
-                font-size: 15pt;
-                text-align: left;
-                max-width: 100000px;
-                min-width: 0px;
-            }}
-            
-            QWidget {{
-                background-color: transparent;
-            }}
-            """
+        # Rows differ only by status colour; build each stylesheet once and
+        # hand Qt the identical string for every row that shares it
+        key = (self.current_theme, status_color)
+        style = self._STYLE_CACHE.get(key)
+        if style is None:
+            style = self._STYLE_CACHE[key] = self._build_stylesheet(status_color)
         
         self.setStyleSheet(style)
 
@@ -189,6 +208,13 @@ class TrainItemWidget(BaseTrainWidget):
         # to end up with dark-theme (white) text on light backgrounds.
         self._apply_theme_to_children(self.current_theme)
 
+    def _build_stylesheet(self, status_color: str) -> str:
+        """Return the item stylesheet for the current theme and a status colour."""
+        # FORCE light theme styling when in light mode
+        template = _LIGHT_STYLE_TMPL if self.current_theme == "light" else _DARK_STYLE_TMPL
+        params = {**self.get_theme_colors(self.current_theme), "status_color": status_color}
+        return template.format_map(params)
+
     def _apply_theme_to_children(self, theme: str) -> None:
         """Propagate theme changes to child components."""
         for child in (
@@ -218,7 +244,7 @@ class TrainItemWidget(BaseTrainWidget):
             return
 
         # Update own theme + stylesheet
-        self.current_theme = theme
+        self.current_theme = sys.intern(theme)
         self._apply_theme_styles()
 
         # Ensure sub-components apply the new theme too.
@@ -2,42 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 
-def theme_colors(theme: str) -> dict[str, str]:
-    """Return theme-specific color palette."""
-
-    if theme == "dark":
-        return {
-            "background_primary": "#1a1a1a",
-            "background_secondary": "#2d2d2d",
-            "background_hover": "#404040",
-            "text_primary": "#ffffff",
-            "text_secondary": "#b0b0b0",
-            "primary_accent": "#1976d2",
-            "border_primary": "#404040",
-            "border_secondary": "#555555",
-            "success": "#4caf50",
-            "warning": "#ff9800",
-            "error": "#f44336",
-        }
-
-    return {
-        "background_primary": "#ffffff",
-        "background_secondary": "#f5f5f5",
-        "background_hover": "#e0e0e0",
-        "text_primary": "#000000",
-        "text_secondary": "#757575",
-        "primary_accent": "#1976d2",
-        "border_primary": "#cccccc",
-        "border_secondary": "#e0e0e0",
-        "success": "#4caf50",
-        "warning": "#ff9800",
-        "error": "#f44336",
-    }
-
-
-def scroll_area_stylesheet(theme: str, colors: dict[str, str]) -> str:
-    """Return the stylesheet for the scroll area."""
+from .train_theme_colors import theme_colors
+
+
+@lru_cache(maxsize=4)
+def scroll_area_stylesheet(theme: str) -> str:
+    """Return the stylesheet for the scroll area (formatted once per theme)."""
 
     if theme == "light":
         return """
@@ -75,6 +47,7 @@ def scroll_area_stylesheet(theme: str, colors: dict[str, str]) -> str:
             }
         """
 
+    colors = theme_colors(theme)
     return f"""
         QScrollArea {{
             border: 1px solid {colors['border_primary']};
@@ -6,14 +6,15 @@ with theme support and real-time updates.
 """
 
 import logging
-from typing import List, Optional
+from typing import List, Mapping, Optional
 from PySide6.QtWidgets import QScrollArea, QWidget, QVBoxLayout, QApplication, QSizePolicy
 from PySide6.QtCore import Qt, Signal, QTimer
 from ...models.train_data import TrainData
-from .train_widgets_base import BaseTrainWidget
 from .custom_scroll_bar import CustomScrollBar
 from .train_item_widget import TrainItemWidget
-from .train_list_theme import scroll_area_stylesheet, theme_colors
+from .train_list_theme import scroll_area_stylesheet
+from .train_theme_colors import theme_colors
+from ..formatters.underground_formatter import UndergroundFormatter
 
 logger = logging.getLogger(__name__)
 
@@ -51,6 +52,8 @@ class TrainListWidget(QScrollArea):
         self.train_manager = train_manager
         self.preferences = preferences or {}
         self.train_items: List[TrainItemWidget] = []
+        # One formatter serves every row instead of one per CallingPointsManager
+        self.underground_formatter = UndergroundFormatter()
 
         self._setup_ui()
         self._apply_theme_styles()
@@ -91,8 +94,7 @@ class TrainListWidget(QScrollArea):
 
     def _apply_theme_styles(self) -> None:
         """Apply theme styling to the scroll area."""
-        colors = theme_colors(self.current_theme)
-        self.setStyleSheet(scroll_area_stylesheet(self.current_theme, colors))
+        self.setStyleSheet(scroll_area_stylesheet(self.current_theme))
 
         # Update custom scroll bar theme
         if hasattr(self, 'custom_scroll_bar'):
@@ -195,7 +197,8 @@ class TrainListWidget(QScrollArea):
                 train_data,
                 self.current_theme,
                 train_manager=self.train_manager,
-                preferences=self.preferences
+                preferences=self.preferences,
+                underground_formatter=self.underground_formatter
             )
             train_item.train_clicked.connect(self.train_selected.emit)
             train_item.route_clicked.connect(self.route_selected.emit)
@@ -227,10 +230,14 @@ class TrainListWidget(QScrollArea):
         """
         self.preferences = preferences or {}
         
-        # Update all existing train items with new preferences
-        for train_item in self.train_items:
-            if hasattr(train_item, 'set_preferences'):
-                train_item.set_preferences(self.preferences)
+        # Update all existing train items; one repaint for all row refreshes
+        self.container_widget.setUpdatesEnabled(False)
+        try:
+            for train_item in self.train_items:
+                if hasattr(train_item, 'set_preferences'):
+                    train_item.set_preferences(self.preferences)
+        finally:
+            self.container_widget.setUpdatesEnabled(True)
         
         self.log_debug(f"Preferences updated for {len(self.train_items)} train items")
 
@@ -453,7 +460,7 @@ class TrainListWidget(QScrollArea):
             # No overflow - hide custom scroll bar
             self.custom_scroll_bar.setVisible(False)
 
-    def get_theme_colors(self, theme: str) -> dict:
+    def get_theme_colors(self, theme: str) -> Mapping[str, str]:
         """Backwards-compatible color palette helper."""
 
         return theme_colors(theme)
@@ -0,0 +1,42 @@
+"""Theme colour palettes shared by the train widgets."""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Mapping
+
+
+# Palettes are fixed per theme; built once and shared read-only
+_DARK_COLORS: Mapping[str, str] = MappingProxyType({
+    "background_primary": "#1a1a1a",
+    "background_secondary": "#2d2d2d",
+    "background_hover": "#404040",
+    "text_primary": "#ffffff",
+    "text_secondary": "#b0b0b0",
+    "primary_accent": "#1976d2",
+    "border_primary": "#404040",
+    "border_secondary": "#555555",
+    "success": "#4caf50",
+    "warning": "#ff9800",
+    "error": "#f44336",
+})
+
+_LIGHT_COLORS: Mapping[str, str] = MappingProxyType({
+    "background_primary": "#ffffff",
+    "background_secondary": "#f5f5f5",
+    "background_hover": "#e0e0e0",
+    "text_primary": "#000000",
+    "text_secondary": "#757575",
+    "primary_accent": "#1976d2",
+    "border_primary": "#cccccc",
+    "border_secondary": "#e0e0e0",
+    "success": "#4caf50",
+    "warning": "#ff9800",
+    "error": "#f44336",
+})
+
+
+def theme_colors(theme: str) -> Mapping[str, str]:
+    """Return theme-specific color palette (shared and read-only)."""
+
+    return _DARK_COLORS if theme == "dark" else _LIGHT_COLORS
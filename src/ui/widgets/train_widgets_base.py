@@ -7,10 +7,12 @@ can inherit from to ensure consistent behavior and theming support.
 
 import logging
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Any, Mapping, Optional
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QObject, Signal
 
+from .train_theme_colors import theme_colors
+
 logger = logging.getLogger(__name__)
 
 
@@ -73,7 +75,7 @@ class BaseTrainWidget(QWidget):
         """
         pass
     
-    def get_theme_colors(self, theme: str) -> Dict[str, str]:
+    def get_theme_colors(self, theme: str) -> Mapping[str, str]:
         """
         Get theme-specific color palette.
         
@@ -81,36 +83,9 @@ class BaseTrainWidget(QWidget):
             theme: Theme name ("dark" or "light")
             
         Returns:
-            Dictionary of color names to hex values
-        """
-        if theme == "dark":
-            return {
-                "background_primary": "#1a1a1a",
-                "background_secondary": "#2d2d2d",
-                "background_hover": "#404040",
-                "text_primary": "#ffffff",
-                "text_secondary": "#b0b0b0",
-                "primary_accent": "#1976d2",
-                "border_primary": "#404040",
-                "border_secondary": "#555555",
-                "success": "#4caf50",
-                "warning": "#ff9800",
-                "error": "#f44336",
-            }
-        else:  # light theme
-            return {
-                "background_primary": "#ffffff",
-                "background_secondary": "#f5f5f5",
-                "background_hover": "#e0e0e0",
-                "text_primary": "#000000",
-                "text_secondary": "#757575",
-                "primary_accent": "#1976d2",
-                "border_primary": "#cccccc",
-                "border_secondary": "#e0e0e0",
-                "success": "#4caf50",
-                "warning": "#ff9800",
-                "error": "#f44336",
-            }
+            Mapping of color names to hex values (shared and read-only)
+        """
+        return theme_colors(theme)
     
     def log_error(self, message: str, exception: Optional[Exception] = None) -> None:
         """
@@ -12,7 +12,6 @@ Requirements:
 
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import Iterable, Sequence
 
 from ..models.astronomy_data import AstronomyEvent, AstronomyEventType
@@ -20,7 +19,7 @@ from ..models.astronomy_data import AstronomyEvent, AstronomyEventType
 
 # Emojis that must not be used in the 7-day event icon grid because the
 # moon-phase glyphs are reserved for the day-level moon display below.
-WEEKVIEW_ICON_EXCLUDE: set[str] = {
+WEEKVIEW_ICON_EXCLUDE: frozenset[str] = frozenset({
     "🌑",
     "🌒",
     "🌓",
@@ -34,27 +33,27 @@ WEEKVIEW_ICON_EXCLUDE: set[str] = {
     "🌛",
     "🌜",
     "🌝",
-}
+})
 
 
 # Per-event-type emoji variants (space oriented). Keep these distinct and avoid
 # common duplicates across types.
-_TYPE_VARIANTS: dict[AstronomyEventType, list[str]] = {
-    AstronomyEventType.APOD: ["🖼️", "🌌", "✨", "🪐"],
-    AstronomyEventType.ISS_PASS: ["🛰️", "👨‍🚀", "🚀", "🛸"],
-    AstronomyEventType.NEAR_EARTH_OBJECT: ["☄️", "🪨", "🌠", "💫"],
+_TYPE_VARIANTS: dict[AstronomyEventType, tuple[str, ...]] = {
+    AstronomyEventType.APOD: ("🖼️", "🌌", "✨", "🪐"),
+    AstronomyEventType.ISS_PASS: ("🛰️", "👨‍🚀", "🚀", "🛸"),
+    AstronomyEventType.NEAR_EARTH_OBJECT: ("☄️", "🪨", "🌠", "💫"),
     # Do NOT use moon emojis in the grid; those are reserved for the day moon display.
-    AstronomyEventType.MOON_PHASE: ["🗓️", "📆", "⏳", "🧮"],
-    AstronomyEventType.PLANETARY_EVENT: ["🪐", "🔭", "🌟", "🧭"],
-    AstronomyEventType.METEOR_SHOWER: ["🌠", "✨", "☄️", "💥"],
-    AstronomyEventType.SOLAR_EVENT: ["☀️", "🌞", "🌤️", "🔥"],
-    AstronomyEventType.SATELLITE_IMAGE: ["📡", "🛰️", "🗺️", "📷"],
-    AstronomyEventType.UNKNOWN: ["❓", "🔭", "🌌", "🧪"],
+    AstronomyEventType.MOON_PHASE: ("🗓️", "📆", "⏳", "🧮"),
+    AstronomyEventType.PLANETARY_EVENT: ("🪐", "🔭", "🌟", "🧭"),
+    AstronomyEventType.METEOR_SHOWER: ("🌠", "✨", "☄️", "💥"),
+    AstronomyEventType.SOLAR_EVENT: ("☀️", "🌞", "🌤️", "🔥"),
+    AstronomyEventType.SATELLITE_IMAGE: ("📡", "🛰️", "🗺️", "📷"),
+    AstronomyEventType.UNKNOWN: ("❓", "🔭", "🌌", "🧪"),
 }
 
 # Global fallback pool used if a type runs out of variants or a collision occurs.
 # Must have enough unique values to cover the worst-case grid (28).
-_FALLBACK_POOL: list[str] = [
+_FALLBACK_POOL: tuple[str, ...] = (
     "🪐",
     "🛰️",
     "🚀",
@@ -87,7 +86,15 @@ _FALLBACK_POOL: list[str] = [
     "🌏",
     "🪨",
     "💥",
-]
+)
+
+# The tables above with the reserved moon glyphs removed, so allocation only
+# has to check for repeats.
+_TYPE_VARIANTS_ALLOWED: dict[AstronomyEventType, tuple[str, ...]] = {
+    event_type: tuple(e for e in variants if e not in WEEKVIEW_ICON_EXCLUDE)
+    for event_type, variants in _TYPE_VARIANTS.items()
+}
+_FALLBACK_ALLOWED: tuple[str, ...] = tuple(e for e in _FALLBACK_POOL if e not in WEEKVIEW_ICON_EXCLUDE)
 
 
 def assign_unique_event_icons(
@@ -108,36 +115,37 @@ def assign_unique_event_icons(
     """
 
     used: set[str] = set()
-    type_counters: dict[AstronomyEventType, int] = defaultdict(int)
-    fallback_idx = 0
+    type_counters: dict[AstronomyEventType, int] = {}
+    # Shared across the grid: each fallback emoji is offered at most once
+    fallback = iter(_FALLBACK_ALLOWED)
 
     result: list[list[str]] = []
 
-    def _allowed(emoji: str) -> bool:
-        return emoji not in WEEKVIEW_ICON_EXCLUDE
+    # Bound once: the loop below runs for every cell of the week grid
+    get_variants = _TYPE_VARIANTS_ALLOWED.get
+    unknown_variants = _TYPE_VARIANTS_ALLOWED[AstronomyEventType.UNKNOWN]
+    mark_used = used.add
 
     def _next_unique_from_pool(pool: Iterable[str]) -> str | None:
-        for emoji in pool:
-            if not _allowed(emoji):
-                continue
-            if emoji not in used:
-                used.add(emoji)
-                return emoji
-        return None
+        emoji = next((e for e in pool if e not in used), None)
+        if emoji is not None:
+            mark_used(emoji)
+        return emoji
 
     for day_events in days_events:
         day_icons: list[str] = []
         for event in list(day_events)[:per_day_limit]:
-            variants = _TYPE_VARIANTS.get(event.event_type, _TYPE_VARIANTS[AstronomyEventType.UNKNOWN])
-            idx = type_counters[event.event_type]
-            type_counters[event.event_type] += 1
+            event_type = event.event_type
+            variants = get_variants(event_type, unknown_variants)
+            idx = type_counters.get(event_type, 0)
+            type_counters[event_type] = idx + 1
 
             # Try deterministic per-type variant first
             chosen = None
             if idx < len(variants):
                 candidate = variants[idx]
-                if _allowed(candidate) and candidate not in used:
-                    used.add(candidate)
+                if candidate not in used:
+                    mark_used(candidate)
                     chosen = candidate
 
             # If collision or out of variants, walk remaining variants
@@ -146,18 +154,12 @@ def assign_unique_event_icons(
 
             # Then global fallback pool
             if chosen is None:
-                while fallback_idx < len(_FALLBACK_POOL):
-                    candidate = _FALLBACK_POOL[fallback_idx]
-                    fallback_idx += 1
-                    if _allowed(candidate) and candidate not in used:
-                        used.add(candidate)
-                        chosen = candidate
-                        break
+                chosen = _next_unique_from_pool(fallback)
 
             # As a last resort, use a unique numeric marker (should never happen)
             if chosen is None:
-                marker = f"{event.event_type.value[:1].upper()}{len(used)}"
-                used.add(marker)
+                marker = f"{event_type.value[:1].upper()}{len(used)}"
+                mark_used(marker)
                 chosen = marker
 
             day_icons.append(chosen)
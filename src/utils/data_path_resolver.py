@@ -29,14 +29,6 @@ def get_data_directory() -> Path:
     module_file = str(__file__)
     cwd = str(Path.cwd())
 
-    nuitka_containing_dir: str | None = None
-    try:
-        import __compiled__  # type: ignore
-
-        nuitka_containing_dir = str(getattr(__compiled__, "containing_dir"))
-    except Exception:
-        nuitka_containing_dir = None
-
     return _get_data_directory_cached(
         override,
         frozen,
@@ -44,10 +36,23 @@ def get_data_directory() -> Path:
         executable,
         module_file,
         cwd,
-        nuitka_containing_dir,
+        _nuitka_containing_dir(),
     )
 
 
+@lru_cache(maxsize=1)
+def _nuitka_containing_dir() -> str | None:
+    # Fixed for the life of the process. Probing it is a failing import in
+    # every non-Nuitka run, which cost more than the rest of
+    # get_data_directory() put together, so it is looked up once.
+    try:
+        import __compiled__  # type: ignore
+
+        return str(getattr(__compiled__, "containing_dir"))
+    except Exception:
+        return None
+
+
 @lru_cache(maxsize=64)
 def _get_data_directory_cached(
     override: str | None,
@@ -67,119 +72,24 @@ def _get_data_directory_cached(
             logger.info("Using TRAINER_DATA_DIR override: %s", override_path)
             return override_path
 
-    # Method 1: Packaged executable environments
-    #
-    # We support multiple packagers:
-    # - PyInstaller-style (`sys.frozen`)
-    # - Nuitka (`__compiled__.containing_dir`)
-    #
-    # Nuitka does not typically set `sys.frozen`, so we detect it explicitly.
-
-    # Nuitka: `__compiled__.containing_dir` points at the directory that contains
-    # the embedded payload. With `--macos-create-app-bundle` this is typically
-    # `.../Trainer.app/Contents/MacOS`.
-    try:
-        if nuitka_containing_dir is None:
-            raise RuntimeError("not nuitka")
-
-        containing_dir = Path(nuitka_containing_dir)
-        if containing_dir.exists():
-            # Prefer src/data if present (matches dev layout).
-            nuitka_src_data_dir = containing_dir / "src" / "data"
-            if nuitka_src_data_dir.exists():
-                logger.info("Resolved data directory via Nuitka containing_dir/src/data: %s", nuitka_src_data_dir)
-                return nuitka_src_data_dir
-
-            # Also allow a flattened data dir.
-            nuitka_data_dir = containing_dir / "data"
-            if nuitka_data_dir.exists():
-                logger.info("Resolved data directory via Nuitka containing_dir/data: %s", nuitka_data_dir)
-                return nuitka_data_dir
-    except Exception:
-        # Not Nuitka or not available.
-        pass
-
-    # PyInstaller (and some other packagers) set `sys.frozen`.
-    if frozen:
-        exe_dir = Path(executable).parent
-        
-        # Handle macOS app bundle structure
-        # On macOS, executable is in Contents/MacOS/ but resources are in Contents/Resources/
-        if platform == "darwin" and exe_dir.name == "MacOS":
-            bundle_contents = exe_dir.parent
-            resources_dir = bundle_contents / "Resources"
-            if resources_dir.exists():
-                # Check for src/data structure in Resources directory
-                src_data_dir = resources_dir / "src" / "data"
-                if src_data_dir.exists():
-                    logger.info("Resolved data directory via frozen macOS Resources/src/data: %s", src_data_dir)
-                    return src_data_dir
-                    
-                # Also check for direct data directory in Resources
-                data_dir = resources_dir / "data"
-                if data_dir.exists():
-                    logger.info("Resolved data directory via frozen macOS Resources/data: %s", data_dir)
-                    return data_dir
-        
-        # Standard packaged executable structure (Windows, Linux)
-        data_dir = exe_dir / "data"
-        if data_dir.exists():
-            logger.info("Resolved data directory via frozen exe_dir/data: %s", data_dir)
-            return data_dir
-            
-        # Also check for src/data structure (for compatibility)
-        src_data_dir = exe_dir / "src" / "data"
-        if src_data_dir.exists():
-            logger.info("Resolved data directory via frozen exe_dir/src/data: %s", src_data_dir)
-            return src_data_dir
-
-    # Method 1b: Nuitka app bundle without relying on `__compiled__`.
-    #
-    # With `--macos-create-app-bundle`, Nuitka places the executable in
-    # `.../Contents/MacOS/`. Data files included via `--include-data-dir=src/data=src/data`
-    # end up under `Contents/MacOS/src/data`.
-    if platform == "darwin":
-        try:
-            if executable:
-                exe_dir = Path(executable).parent
-                if exe_dir.name == "MacOS":
-                    # Prefer the location we actually ship for Nuitka app bundles.
-                    macos_src_data = exe_dir / "src" / "data"
-                    if macos_src_data.exists():
-                        logger.info("Resolved data directory via macOS app bundle MacOS/src/data: %s", macos_src_data)
-                        return macos_src_data
-                    macos_data = exe_dir / "data"
-                    if macos_data.exists():
-                        logger.info("Resolved data directory via macOS app bundle MacOS/data: %s", macos_data)
-                        return macos_data
-
-                    # Also check the canonical app-bundle resources location.
-                    resources_dir = exe_dir.parent / "Resources"
-                    resources_src_data = resources_dir / "src" / "data"
-                    if resources_src_data.exists():
-                        logger.info(
-                            "Resolved data directory via macOS app bundle Resources/src/data: %s",
-                            resources_src_data,
-                        )
-                        return resources_src_data
-                    resources_data = resources_dir / "data"
-                    if resources_data.exists():
-                        logger.info(
-                            "Resolved data directory via macOS app bundle Resources/data: %s",
-                            resources_data,
-                        )
-                        return resources_data
-        except Exception:
-            pass
-
-    # Method 1c: importlib.resources
+    # Method 1: Packaged executable environments (PyInstaller, Nuitka and
+    # macOS app bundles), probed in priority order; see _packaged_candidates()
+    exe_dir = Path(executable).parent
+    in_macos_bundle = platform == "darwin" and exe_dir.name == "MacOS"
+    for candidate, source in _packaged_candidates(frozen, exe_dir, in_macos_bundle, nuitka_containing_dir):
+        # One stat per candidate rather than exists() followed by is_dir()
+        if os.path.isdir(candidate):
+            logger.info("Resolved data directory via %s: %s", source, candidate)
+            return candidate
+
+    # Method 1b: importlib.resources
     #
     # This is robust for packaged builds where `src.data` is embedded as a
     # package and `as_file()` can materialize a filesystem location.
     #
     # IMPORTANT: Do not use this in normal dev/test runs because it bypasses
     # monkeypatched paths in unit tests (the package is importable from the repo).
-    if frozen or nuitka_containing_dir or (platform == "darwin" and Path(executable).parent.name == "MacOS"):
+    if frozen or nuitka_containing_dir or in_macos_bundle:
         try:
             from importlib.resources import files as resource_files, as_file
 
@@ -196,6 +106,8 @@ def _get_data_directory_cached(
     
     # Method 2: Development environment - relative to this file
     # This file is in src/utils/, so data is at ../data/
+    # (In a plain dev run none of the packaged checks above touch the
+    # filesystem, so this is the first path probed.)
     dev_data_dir = Path(module_file).parent.parent / "data"
     if dev_data_dir.exists():
         logger.info("Resolved data directory via dev path: %s", dev_data_dir)
@@ -236,6 +148,62 @@ def _get_data_directory_cached(
     )
 
 
+def _packaged_candidates(
+    frozen: bool,
+    exe_dir: Path,
+    in_macos_bundle: bool,
+    nuitka_containing_dir: str | None,
+) -> list[tuple[Path, str]]:
+    """
+    List packaged-build data directories to probe, in priority order.
+    
+    Returns:
+        (path, description) pairs; the description is used for logging
+    """
+    candidates: list[tuple[Path, str]] = []
+
+    # Nuitka does not typically set `sys.frozen`, so it is detected through
+    # `__compiled__.containing_dir`: the directory holding the embedded
+    # payload (`.../Trainer.app/Contents/MacOS` for app bundles). Prefer
+    # src/data (matches dev layout), then a flattened data dir.
+    if nuitka_containing_dir is not None:
+        containing_dir = Path(nuitka_containing_dir)
+        candidates.append((containing_dir / "src" / "data", "Nuitka containing_dir/src/data"))
+        candidates.append((containing_dir / "data", "Nuitka containing_dir/data"))
+
+    # macOS app bundles keep resources in Contents/Resources/, next to the
+    # executable's Contents/MacOS/
+    resources_dir = exe_dir.parent / "Resources"
+
+    # PyInstaller (and some other packagers) set `sys.frozen`.
+    if frozen:
+        if in_macos_bundle:
+            candidates.append((resources_dir / "src" / "data", "frozen macOS Resources/src/data"))
+            candidates.append((resources_dir / "data", "frozen macOS Resources/data"))
+        # Standard packaged executable structure (Windows, Linux), then
+        # src/data for compatibility
+        candidates.append((exe_dir / "data", "frozen exe_dir/data"))
+        candidates.append((exe_dir / "src" / "data", "frozen exe_dir/src/data"))
+
+    # Nuitka app bundle without relying on `__compiled__`: with
+    # `--macos-create-app-bundle` data included via
+    # `--include-data-dir=src/data=src/data` ends up under Contents/MacOS/src/data.
+    if in_macos_bundle:
+        candidates.append((exe_dir / "src" / "data", "macOS app bundle MacOS/src/data"))
+        candidates.append((exe_dir / "data", "macOS app bundle MacOS/data"))
+        candidates.append((resources_dir / "src" / "data", "macOS app bundle Resources/src/data"))
+        candidates.append((resources_dir / "data", "macOS app bundle Resources/data"))
+
+    # A frozen bundle lists some paths twice; probe each only once
+    unique: list[tuple[Path, str]] = []
+    seen: set[Path] = set()
+    for path, source in candidates:
+        if path not in seen:
+            seen.add(path)
+            unique.append((path, source))
+    return unique
+
+
 def get_lines_directory() -> Path:
     """Get the lines subdirectory within the data directory."""
     return get_data_directory() / "lines"
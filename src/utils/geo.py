@@ -6,6 +6,7 @@ This module intentionally stays dependency-free so it can be reused by services
 from __future__ import annotations
 
 import math
+from typing import Sequence
 
 
 def haversine_distance_km(coord1: dict, coord2: dict) -> float:
@@ -31,3 +32,28 @@ def haversine_distance_km(coord1: dict, coord2: dict) -> float:
     earth_radius_km = 6371.0
     return earth_radius_km * c
 
+
+def haversine_leg_distances_km(coords: Sequence[dict]) -> list[float]:
+    """Return the Haversine distance of each consecutive pair in ``coords``.
+
+    Batch form of :func:`haversine_distance_km` for walking a line's stations:
+    each coordinate is converted to radians, and its latitude cosine taken,
+    once instead of once per neighbouring pair. Results are identical to the
+    pairwise function.
+    """
+
+    points = [(math.radians(c["lat"]), math.radians(c["lng"])) for c in coords]
+    cos_lats = [math.cos(lat) for lat, _ in points]
+
+    earth_radius_km = 6371.0
+    distances: list[float] = []
+    for i in range(len(points) - 1):
+        lat1, lon1 = points[i]
+        lat2, lon2 = points[i + 1]
+        a = (
+            math.sin((lat2 - lat1) / 2) ** 2
+            + cos_lats[i] * cos_lats[i + 1] * math.sin((lon2 - lon1) / 2) ** 2
+        )
+        c = 2 * math.asin(math.sqrt(a))
+        distances.append(earth_radius_km * c)
+    return distances
@@ -8,11 +8,14 @@ The goal is *stable equality* for deduplication, not full RFC URL normalization.
 
 from __future__ import annotations
 
+import re
+from functools import lru_cache
+from operator import itemgetter
 from typing import Iterable, Optional
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 
-_TRACKING_QUERY_KEYS = {
+_TRACKING_QUERY_KEYS = frozenset({
     "utm_source",
     "utm_medium",
     "utm_campaign",
@@ -26,12 +29,52 @@ _TRACKING_QUERY_KEYS = {
     "utm_swu",
     "gclid",
     "fbclid",
-}
+})
 
+# Queries made only of these characters come out of parse_qsl/urlencode with
+# their fields unchanged, so they can be split and re-joined directly.
+_PLAIN_QUERY_RE = re.compile(r"[A-Za-z0-9_.~&=-]*")
 
+
+def _sort_query_pairs(pairs: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Drop tracking parameters and sort the rest by key, then value."""
+
+    # Each key is lower-cased once and reused as the sort key
+    keyed = []
+    for k, v in pairs:
+        lowered = k.lower()
+        if lowered not in _TRACKING_QUERY_KEYS:
+            keyed.append(((lowered, v), k, v))
+    keyed.sort(key=itemgetter(0))
+    return [(k, v) for _, k, v in keyed]
+
+
+def _canonical_query(query: str) -> str:
+    """Return *query* without tracking parameters and with its fields sorted."""
+
+    if _PLAIN_QUERY_RE.fullmatch(query):
+        pairs = []
+        for field in query.split("&"):
+            if not field:
+                continue
+            key, _, value = field.partition("=")
+            if "=" in value:
+                # urlencode would escape the second '='; take the full path
+                break
+            pairs.append((key, value))
+        else:
+            return "&".join(f"{k}={v}" for k, v in _sort_query_pairs(pairs))
+
+    query_pairs = parse_qsl(query, keep_blank_values=True)
+    return urlencode(_sort_query_pairs(query_pairs), doseq=True)
+
+
+@lru_cache(maxsize=4096)
 def canonicalize_url(url: str) -> str:
     """Return a canonical form of *url* suitable for de-duplication.
 
+    Results are memoised: feeds repeat the same URLs across polls.
+
     Rules:
     - lower-case scheme + hostname
     - drop default ports (80 for http, 443 for https)
@@ -64,10 +107,7 @@ def canonicalize_url(url: str) -> str:
     path = (parts.path or "").rstrip("/")
 
     # Normalize query ordering and drop common tracking keys
-    query_pairs = parse_qsl(parts.query, keep_blank_values=True)
-    filtered_pairs = [(k, v) for (k, v) in query_pairs if k.lower() not in _TRACKING_QUERY_KEYS]
-    filtered_pairs.sort(key=lambda kv: (kv[0].lower(), kv[1]))
-    query = urlencode(filtered_pairs, doseq=True)
+    query = _canonical_query(parts.query)
 
     return urlunsplit((scheme, netloc, path, query, ""))
 
@@ -77,12 +117,16 @@ def dedupe_urls(urls: Iterable[str]) -> list[str]:
 
     seen: set[str] = set()
     result: list[str] = []
+    append = result.append
     for url in urls:
         canon = canonicalize_url(url)
-        if not canon or canon in seen:
+        if not canon:
             continue
+        # One lookup per URL: the set only grows when canon is new
+        size = len(seen)
         seen.add(canon)
-        result.append(url)
+        if len(seen) != size:
+            append(url)
     return result
 
 
@@ -94,9 +138,11 @@ def first_unique_url(candidates: Iterable[str], used_canonical: set[str]) -> Opt
 
     for url in candidates:
         canon = canonicalize_url(url)
-        if not canon or canon in used_canonical:
+        if not canon:
             continue
+        size = len(used_canonical)
         used_canonical.add(canon)
-        return url
+        if len(used_canonical) != size:
+            return url
     return None
 
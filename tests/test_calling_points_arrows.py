@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.managers.services.route_calc_components.route_objects import MinimalSegment
+from src.ui.formatters.underground_formatter import UndergroundFormatter
+from src.ui.widgets.train_components.calling_points_arrows import (
+    ARROW_WALKING,
+    arrow_html,
+    precompute_arrow_specs,
+)
+
+
+class _Train:
+    def __init__(self, segments):
+        self.route_segments = segments
+
+
+def test_precompute_arrow_specs_keys_walking_pairs_in_either_direction() -> None:
+    walk = MinimalSegment(from_station="A", to_station=" B ", is_walking=True)
+    rail = MinimalSegment(from_station="B", to_station="C", is_walking=False)
+
+    specs = precompute_arrow_specs(_Train([walk, rail]), UndergroundFormatter())
+
+    kind, text = specs[frozenset(("B", "A"))]
+    assert kind == ARROW_WALKING
+    assert "Walk" in text
+    assert frozenset(("B", "C")) not in specs
+
+
+def test_precompute_arrow_specs_without_segments_is_empty() -> None:
+    assert precompute_arrow_specs(None, UndergroundFormatter()) == {}
+
+
+def test_arrow_html_inlines_walking_style_and_defaults_to_accent() -> None:
+    walk = MinimalSegment(from_station="A", to_station="B", is_walking=True)
+    specs = precompute_arrow_specs(_Train([walk]), UndergroundFormatter())
+    colors = {"primary_accent": "#123456"}
+
+    walking = arrow_html(
+        theme_colors=colors, prev_station_raw="B ", curr_station_raw="A", arrow_specs=specs
+    )
+    default = arrow_html(
+        theme_colors=colors, prev_station_raw="A", curr_station_raw="C", arrow_specs=specs
+    )
+
+    assert "color:#f44336" in walking
+    assert "Walk" in walking
+    assert " " not in walking.split(">", 1)[1]  # padding survives rich-text collapsing
+    assert "color:#123456" in default
+    assert "→" in default
+
+
+class _CountingFormatter(UndergroundFormatter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.checked: list[object] = []
+
+    def is_underground_segment(self, segment) -> bool:
+        self.checked.append(segment)
+        return super().is_underground_segment(segment)
+
+
+def test_precompute_arrow_specs_classifies_each_segment_in_one_pass() -> None:
+    walk = MinimalSegment(from_station="A", to_station="B", is_walking=True)
+    tube = SimpleNamespace(
+        from_station="B", to_station="A", line_name="UNDERGROUND", service_pattern="UNDERGROUND"
+    )
+    rail = MinimalSegment(from_station="B", to_station="C", is_walking=False)
+    formatter = _CountingFormatter()
+
+    specs = precompute_arrow_specs(_Train([walk, tube, rail]), formatter)
+
+    # Walking wins for A-B without probing the underground segment behind it
+    assert specs[frozenset(("A", "B"))][0] == ARROW_WALKING
+    assert all(segment is not tube for segment in formatter.checked)
+    assert sum(segment is rail for segment in formatter.checked) == 1
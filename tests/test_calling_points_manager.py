@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime
+
+from PySide6.QtWidgets import QLabel, QLayout
+
+from src.models.train_data import CallingPoint, ServiceType, TrainData, TrainStatus
+from src.ui.widgets.train_components import CallingPointsManager
+
+
+def _train(names: list[str]) -> TrainData:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    cps = [
+        CallingPoint(
+            station_name=name,
+            scheduled_arrival=now,
+            scheduled_departure=now,
+            expected_arrival=now,
+            expected_departure=now,
+            platform=None,
+            is_origin=i == 0,
+            is_destination=i == len(names) - 1,
+        )
+        for i, name in enumerate(names)
+    ]
+    return TrainData(
+        departure_time=now,
+        scheduled_departure=now,
+        destination=names[-1],
+        platform="1",
+        operator="Operator",
+        service_type=ServiceType.FAST,
+        status=TrainStatus.ON_TIME,
+        delay_minutes=0,
+        estimated_arrival=now,
+        journey_duration=None,
+        current_location=None,
+        train_uid="uid",
+        service_id="service",
+        calling_points=cps,
+        route_segments=None,
+        full_calling_points=None,
+    )
+
+
+def test_calling_point_lines_use_inline_colours_not_per_label_stylesheets(qtbot) -> None:
+    manager = CallingPointsManager(_train(["Origin", "Destination"]), theme="light")
+    qtbot.addWidget(manager)
+    manager.show()
+
+    labels = [
+        label
+        for label in manager.calling_points_widget.findChildren(QLabel)
+        if not label.isHidden()
+    ]
+
+    assert len(labels) == 1
+    assert labels[0].styleSheet() == ""
+    assert "color:#1976d2" in labels[0].text()
+    assert "color: #212121" in manager.styleSheet()
+
+
+def test_wrapped_lines_share_one_rich_text_label(qtbot) -> None:
+    manager = CallingPointsManager(_train(["A", "London Waterloo", "London Victoria", "London Bridge", "E"]), theme="dark")
+    qtbot.addWidget(manager)
+    manager.show()
+
+    texts = [
+        label.text()
+        for label in manager.calling_points_widget.findChildren(QLabel)
+        if not label.isHidden()
+    ]
+
+    # Line breaks and the continuation indent are markup, not extra widgets
+    assert len(texts) == 1
+    assert texts[0].count("<br>&nbsp;") == 1
+    # ...and no blank spacer labels exist, shown or hidden
+    assert all(label.text().strip() for label in manager.calling_points_widget.findChildren(QLabel))
+
+
+def test_manager_without_train_data_renders_once_data_arrives(qtbot) -> None:
+    manager = CallingPointsManager(None, theme="dark")
+    qtbot.addWidget(manager)
+    manager.show()
+    assert manager._stops_label.isHidden()
+
+    manager.set_train_data(_train(["Origin", "Destination"]))
+    qtbot.waitUntil(lambda: not manager._stops_label.isHidden())
+    assert "Destination" in manager._stops_label.text()
+
+
+def test_equal_content_in_a_new_train_object_leaves_the_layout_alone(qtbot, monkeypatch) -> None:
+    train = _train(["Origin", "London Waterloo", "Destination"])
+    manager = CallingPointsManager(train, theme="dark")
+    qtbot.addWidget(manager)
+    manager.show()
+
+    texts: list[str] = []
+    monkeypatch.setattr(manager._stops_label, "setText", texts.append)
+
+    manager.set_train_data(replace(train, delay_minutes=3))
+    qtbot.wait(CallingPointsManager.REFRESH_DELAY_MS * 2)
+    assert texts == []
+
+    manager.set_train_data(replace(train, calling_points=train.calling_points[::2]))
+    qtbot.waitUntil(lambda: len(texts) == 1)
+
+
+def test_switching_to_and_from_direct_service_does_not_accumulate_widgets(qtbot) -> None:
+    train = _train(["Origin", "London Waterloo", "Destination"])
+    direct = replace(train, calling_points=train.calling_points[:1])
+    manager = CallingPointsManager(train, theme="dark")
+    qtbot.addWidget(manager)
+    manager.show()
+
+    manager.set_train_data(direct)
+    manager._refresh_display()
+    direct_row = manager.calling_points_layout.itemAt(0).widget()
+    assert direct_row is not None and direct_row.parent() is manager.calling_points_widget
+
+    for data in (train, direct, train):
+        manager.set_train_data(data)
+        manager._refresh_display()
+    # The row stays owned by the container and is hidden, not detached
+    assert direct_row.isHidden()
+    assert not manager._stops_label.isHidden()
+    assert manager.calling_points_layout.itemAt(0).widget() is direct_row
+
+    manager.set_train_data(direct)
+    manager._refresh_display()
+
+    container = manager.calling_points_widget
+    assert len(container.findChildren(QLabel)) == 2  # stops label + direct label
+    assert len(container.findChildren(QLayout)) == 2  # container layout + direct row
+    assert manager.calling_points_layout.count() == 2  # direct row + stops label
+    assert manager.calling_points_layout.itemAt(0).widget() is direct_row  # recycled
+    assert not direct_row.isHidden()
+    assert manager._stops_label.isHidden()
+
+
+def test_lines_are_built_on_first_show(qtbot) -> None:
+    train = _train(["Origin", "Destination"])
+    manager = CallingPointsManager(train, theme="dark")
+    qtbot.addWidget(manager)
+
+    manager.set_train_data(replace(train, delay_minutes=3))
+    qtbot.wait(CallingPointsManager.REFRESH_DELAY_MS * 2)
+    assert manager._stops_label.text() == ""
+
+    manager.show()
+    assert "Destination" in manager._stops_label.text()
+
+
+def test_train_rows_share_the_list_underground_formatter(qtbot) -> None:
+    from src.ui.widgets.train_list_widget import TrainListWidget
+
+    widget = TrainListWidget(max_trains=5)
+    qtbot.addWidget(widget)
+    widget.add_train_item(_train(["A", "B"]))
+    widget.add_train_item(_train(["C", "D"]))
+
+    filters = [item.calling_points_manager.station_filter_service for item in widget.train_items]
+    # Each row memoises per train, but all wrap the list's single formatter
+    assert len(filters) == 2
+    assert all(f.underground_formatter._formatter is widget.underground_formatter for f in filters)
+
+
+def test_list_preference_change_refreshes_rows_with_painting_suspended(qtbot, monkeypatch) -> None:
+    from src.ui.widgets.train_list_widget import TrainListWidget
+
+    widget = TrainListWidget(max_trains=5)
+    qtbot.addWidget(widget)
+    widget.show()
+    widget.add_train_item(_train(["A", "B"]))
+    widget.add_train_item(_train(["C", "D"]))
+
+    painting: list[bool] = []
+    for item in widget.train_items:
+        manager = item.calling_points_manager
+        monkeypatch.setattr(
+            manager, "_refresh_display",
+            lambda: painting.append(widget.container_widget.updatesEnabled()),
+        )
+
+    widget.set_preferences({"show_intermediate_stations": False})
+
+    assert painting == [False, False]
+    assert widget.container_widget.updatesEnabled()
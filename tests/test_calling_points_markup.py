@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.ui.widgets.train_components.calling_points_markup import (
+    LINE_INDENT,
+    STOPS_PREFIX,
+    calling_point_lines,
+    derive_station_view,
+)
+from src.ui.widgets.train_components.calling_points_styling import station_text_colors
+from src.ui.widgets.train_components.station_names import station_name_markers
+
+
+def _cp(name: str, *, origin: bool = False, destination: bool = False):
+    return SimpleNamespace(station_name=name, is_origin=origin, is_destination=destination)
+
+
+def test_calling_point_lines_wraps_three_stations_per_line() -> None:
+    colors = {"text_primary": "#fff", "warning": "#fa0", "primary_accent": "#0af"}
+    points = [_cp(" A ", origin=True), _cp("B"), _cp("C"), _cp("D"), _cp("E", destination=True)]
+    stations = [derive_station_view(cp, cp.station_name == "C") for cp in points]
+
+    lines = calling_point_lines(
+        stations,
+        station_colors=station_text_colors("dark", colors),
+        theme_colors=colors,
+        arrow_specs={},
+    )
+
+    assert len(lines) == 2
+    assert lines[0].startswith(STOPS_PREFIX)
+    assert lines[1].startswith(LINE_INDENT)
+    assert "<span style='color:#fff; font-weight:bold'>A</span>" in lines[0]
+    assert "<span style='color:#fa0; font-style:italic'>C</span>" in lines[0]
+    assert lines[1].count("→") == 2
+
+
+def test_derive_station_view_detects_walking_markers_only_in_html() -> None:
+    walking = derive_station_view(
+        _cp("<font color='#f44336'>Walk 1.2km (15min)</font>"), True
+    )
+    plain = derive_station_view(_cp(" <font color='#f44336' "), False)
+
+    assert walking.style_kind == "walking"
+    assert walking.display_name == walking.raw_name
+    assert plain.style_kind == "normal"
+
+
+def test_station_name_markers_classify_in_one_pass() -> None:
+    assert station_name_markers("Clapham Junction") == (False, False)
+    assert station_name_markers("<font color='#DC241F'>🚇 Underground</font>") == (True, False)
+    assert station_name_markers("<font color='#f44336'>Walking connection</font>") == (True, True)
+    assert station_name_markers("<font color='#f44336'>unterminated") == (False, False)
+
+
+def test_full_last_line_does_not_start_an_empty_line() -> None:
+    colors = {"text_primary": "#fff", "warning": "#fa0", "primary_accent": "#0af"}
+    stations = [derive_station_view(_cp(name), False) for name in "ABCDEF"]
+
+    lines = calling_point_lines(
+        stations,
+        station_colors=station_text_colors("dark", colors),
+        theme_colors=colors,
+        arrow_specs={},
+    )
+
+    assert len(lines) == 2
+    assert lines[1].startswith(LINE_INDENT) and lines[1].count("→") == 3
@@ -77,3 +77,55 @@ def test_get_data_directory_raises_when_no_locations_exist(tmp_path: Path, monke
     with pytest.raises(FileNotFoundError):
         resolver.get_data_directory()
 
+
+def test_line_file_paths_follow_the_resolved_directory(tmp_path: Path, monkeypatch):
+    fake_utils_dir = tmp_path / "src" / "utils"
+    fake_utils_dir.mkdir(parents=True)
+    (tmp_path / "src" / "data").mkdir(parents=True)
+    monkeypatch.setattr(resolver, "__file__", str(fake_utils_dir / "data_path_resolver.py"))
+    monkeypatch.setattr(sys, "frozen", False, raising=False)
+
+    assert resolver.get_line_file_path("central_line.json") == tmp_path / "src" / "data" / "lines" / "central_line.json"
+    assert resolver.get_data_file_path("railway_lines_index.json") == tmp_path / "src" / "data" / "railway_lines_index.json"
+
+
+def test_development_mode_probes_the_dev_path_first(tmp_path: Path, monkeypatch):
+    fake_utils_dir = tmp_path / "src" / "utils"
+    fake_utils_dir.mkdir(parents=True)
+    (tmp_path / "src" / "data").mkdir(parents=True)
+    monkeypatch.setattr(resolver, "__file__", str(fake_utils_dir / "data_path_resolver.py"))
+    monkeypatch.setattr(sys, "frozen", False, raising=False)
+    monkeypatch.setattr(sys, "platform", "linux", raising=False)
+
+    probed: list[Path] = []
+    original_exists = Path.exists
+
+    def counting_exists(self, *args, **kwargs):
+        probed.append(self)
+        return original_exists(self, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "exists", counting_exists)
+
+    assert resolver.get_data_directory() == tmp_path / "src" / "data"
+    assert probed == [tmp_path / "src" / "data"]
+
+
+def test_frozen_macos_bundle_probes_each_candidate_once(tmp_path: Path, monkeypatch):
+    exe_dir = tmp_path / "MyApp.app" / "Contents" / "MacOS"
+    (exe_dir / "src" / "data").mkdir(parents=True)
+    monkeypatch.setattr(sys, "executable", str(exe_dir / "myapp"))
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(sys, "platform", "darwin", raising=False)
+
+    probed: list[str] = []
+    original_isdir = resolver.os.path.isdir
+
+    def counting_isdir(path):
+        probed.append(str(path))
+        return original_isdir(path)
+
+    monkeypatch.setattr(resolver.os.path, "isdir", counting_isdir)
+
+    # Resources/ is absent, so this resolves via the frozen exe_dir/src/data probe
+    assert resolver.get_data_directory() == exe_dir / "src" / "data"
+    assert len(probed) == len(set(probed)) == 4
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import math
 
-from src.utils.geo import haversine_distance_km
+from src.utils.geo import haversine_distance_km, haversine_leg_distances_km
 
 
 def test_haversine_distance_km_zero_distance_is_zero():
@@ -17,3 +17,17 @@ def test_haversine_distance_km_known_distance_equator_one_degree_longitude():
     dist = haversine_distance_km(coord1, coord2)
     assert math.isclose(dist, 111.195, rel_tol=0.0, abs_tol=0.5)
 
+
+def test_haversine_leg_distances_km_match_pairwise_distances():
+    coords = [
+        {"lat": 51.5031, "lng": -0.1132},
+        {"lat": 51.4640, "lng": -0.1703},
+        {"lat": 51.3190, "lng": -0.5566},
+        {"lat": 51.3190, "lng": -0.5566},
+    ]
+
+    legs = haversine_leg_distances_km(coords)
+
+    assert legs == [haversine_distance_km(a, b) for a, b in zip(coords, coords[1:])]
+    assert legs[-1] == 0.0
+    assert haversine_leg_distances_km(coords[:1]) == []
@@ -76,3 +76,6 @@ def test_train_item_widget_propagates_light_theme_to_children(qtbot):
     assert "color: #212121" in w.calling_points_manager.styleSheet()
     assert "color: #212121" in w.location_section.styleSheet()
 
+    # The status colour follows the theme via the section's property rules.
+    assert w.details_section.status_info.property("trainStatus") == "on_time"
+    assert 'QLabel[trainStatus="on_time"] { color: #388e3c; }' in w.details_section.styleSheet()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime
+
+from src.models.train_data import ServiceType, TrainData, TrainStatus
+from src.ui.widgets.train_components import LocationInfoSection
+
+
+def _train(location: str | None) -> TrainData:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    return TrainData(
+        departure_time=now,
+        scheduled_departure=now,
+        destination="Destination",
+        platform="1",
+        operator="Operator",
+        service_type=ServiceType.FAST,
+        status=TrainStatus.ON_TIME,
+        delay_minutes=0,
+        estimated_arrival=now,
+        journey_duration=None,
+        current_location=location,
+        train_uid="uid",
+        service_id="service",
+        calling_points=[],
+    )
+
+
+def test_labels_are_only_updated_when_location_or_arrival_change(qtbot, monkeypatch) -> None:
+    train = _train("Woking")
+    section = LocationInfoSection(train, theme="dark")
+    qtbot.addWidget(section)
+    assert section.location_info.text() == "Current: Woking 📍"
+
+    location_texts: list[str] = []
+    monkeypatch.setattr(section.location_info, "setText", location_texts.append)
+
+    section.set_train_data(replace(train, delay_minutes=3))
+    assert location_texts == []
+
+    section.set_train_data(replace(train, current_location="Clapham Junction"))
+    assert location_texts == ["Current: Clapham Junction 📍"]
+
+    section.set_train_data(replace(train, current_location=None))
+    assert section.location_info.isHidden()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from src.ui.widgets.route_display_dialog_helpers import (
+    station_has_underground_connection,
+    underground_endpoint_stations,
+)
+
+
+class _UndergroundByLine:
+    def is_underground_segment(self, segment):
+        return segment.line_name == "Underground"
+
+
+def test_station_has_underground_connection_uses_segment_endpoints():
+    train_data = SimpleNamespace(
+        route_segments=[
+            SimpleNamespace(from_station="A", to_station="B", line_name="Rail"),
+            SimpleNamespace(from_station="B", to_station="C", line_name="Underground"),
+        ]
+    )
+    formatter = _UndergroundByLine()
+
+    endpoints = underground_endpoint_stations(
+        train_data=train_data, underground_formatter=formatter
+    )
+    assert endpoints == frozenset({"B", "C"})
+
+    for station, expected in (("A", False), ("B", True), ("C", True)):
+        assert (
+            station_has_underground_connection(
+                train_data=train_data,
+                underground_formatter=formatter,
+                station_name=station,
+            )
+            is expected
+        )
+
+
+def test_route_dialog_classifies_each_segment_once(qtbot, monkeypatch):
+    from datetime import datetime
+
+    from src.models.train_data import CallingPoint, ServiceType, TrainData, TrainStatus
+    from src.ui.formatters.underground_formatter import UndergroundFormatter
+    from src.ui.widgets.route_display_dialog import RouteDisplayDialog
+
+    calls = []
+    original = UndergroundFormatter.is_underground_segment
+
+    def counting(self, segment):
+        calls.append(segment)
+        return original(self, segment)
+
+    monkeypatch.setattr(UndergroundFormatter, "is_underground_segment", counting)
+
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    names = ["Woking", "London Waterloo", "London Kings Cross", "Leeds"]
+    segments = [
+        SimpleNamespace(from_station=a, to_station=b, line_name=line, service_pattern=pattern,
+                        distance_km=None, journey_time_minutes=None)
+        for a, b, line, pattern in [
+            ("Woking", "London Waterloo", "South Western", "FAST"),
+            ("London Waterloo", "London Kings Cross", "London Underground", "UNDERGROUND"),
+            ("London Kings Cross", "Leeds", "East Coast", "FAST"),
+        ]
+    ]
+    train = TrainData(
+        departure_time=now, scheduled_departure=now, destination="Leeds", platform="1",
+        operator="Operator", service_type=ServiceType.FAST, status=TrainStatus.ON_TIME,
+        delay_minutes=0, estimated_arrival=now, journey_duration=None, current_location=None,
+        train_uid="uid", service_id="service",
+        calling_points=[
+            CallingPoint(name, now, now, now, now, None, is_origin=i == 0, is_destination=i == 3)
+            for i, name in enumerate(names)
+        ],
+        route_segments=segments,
+    )
+
+    dialog = RouteDisplayDialog(train, theme="dark")
+    qtbot.addWidget(dialog)
+
+    assert dialog._underground_endpoint_names() == {"London Waterloo", "London Kings Cross"}
+    assert len(calls) == len(segments)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+
+# UTF-8 arrows/emoji that were decoded as cp1252 and saved again render as
+# garbage in Qt labels (e.g. "→" -> "â†’", "🚇" -> "ðŸš‡").
+MOJIBAKE_MARKERS = ("â†", "ðŸ", "â€")
+
+
+def test_src_python_files_contain_no_mojibake():
+    repo_root = Path(__file__).resolve().parents[1]
+
+    offenders: list[str] = []
+    for path in sorted((repo_root / "src").rglob("*.py")):
+        text = path.read_text(encoding="utf-8", errors="replace")
+        for lineno, line in enumerate(text.splitlines(), start=1):
+            if any(marker in line for marker in MOJIBAKE_MARKERS):
+                offenders.append(f"{path.relative_to(repo_root).as_posix()}:{lineno}")
+
+    assert not offenders, "Mojibake detected in source files:\n" + "\n".join(offenders)
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+from src.ui.widgets.train_components.station_filter_service import StationFilterService
+
+
+def _fail(*args):
+    raise AssertionError(args)
+
+
+def _seg(src: str, dst: str, line: str, train_id: str | None = None):
+    return SimpleNamespace(from_station=src, to_station=dst, line_name=line, train_id=train_id)
+
+
+def test_journey_interchanges_are_indexed_per_train(qtbot) -> None:
+    train = SimpleNamespace(
+        route_segments=[
+            _seg("A", "B ", "Line 1"),
+            _seg(" B", "C", "Line 2"),
+            _seg("C", "D", "Line 3", train_id="T1"),
+            _seg("D", "E", "Line 4", train_id="T1"),
+        ]
+    )
+    service = StationFilterService(train)
+    qtbot.addWidget(service)
+
+    assert service.is_actual_user_journey_interchange(" B ")
+    assert service.is_actual_user_journey_interchange("C")
+    assert not service.is_actual_user_journey_interchange("D")  # same physical train
+    assert not service.is_actual_user_journey_interchange("A")
+
+    service.set_train_data(SimpleNamespace(route_segments=[_seg("A", "B", "Line 1")]))
+    assert not service.is_actual_user_journey_interchange("B")
+
+
+def test_user_interchange_flags_match_per_station_checks(qtbot) -> None:
+    train = SimpleNamespace(
+        route_segments=[_seg("A", "B", "Line 1"), _seg("B", "C (Cross Country Line)", "Line 2")]
+    )
+    service = StationFilterService(train)
+    qtbot.addWidget(service)
+    names = ["A", " B ", "C (Cross Country Line)", "<font color='#f44336'>Walk</font>", None]
+    points = [SimpleNamespace(station_name=name) for name in names]
+
+    flags = service.user_interchange_flags(points)
+
+    assert flags == [service.is_actual_user_journey_interchange(name or "") for name in names]
+    assert flags == [False, True, False, False, False]
+
+
+def test_filter_calling_points_keeps_first_position_and_prefers_richer_duplicates(qtbot) -> None:
+    service = StationFilterService(None)
+    qtbot.addWidget(service)
+
+    def cp(name, platform=None, origin=False):
+        return SimpleNamespace(station_name=name, platform=platform, is_origin=origin, is_destination=False)
+
+    a, b, b_platform, c, a_origin = cp("A"), cp("B"), cp("B", "2"), cp("C"), cp("A", origin=True)
+    padded, padded_again = cp(" D "), cp("D", "1")
+
+    result = service.filter_calling_points([a, b, c, b_platform, a_origin, padded, padded_again])
+
+    assert result == [a_origin, b_platform, c, padded]
+
+
+def test_route_segments_are_scanned_once_per_train(qtbot) -> None:
+    class CountingSegments(list):
+        scans = 0
+
+        def __iter__(self):
+            CountingSegments.scans += 1
+            return super().__iter__()
+
+    segments = CountingSegments([_seg("A", "B", "Line 1"), _seg("B", "C", "Line 2")])
+    service = StationFilterService(SimpleNamespace(route_segments=segments))
+    qtbot.addWidget(service)
+    points = [SimpleNamespace(station_name=name) for name in "ABC" * 10]
+
+    for point in points:
+        service.is_actual_user_journey_interchange(point.station_name)
+    service.user_interchange_flags(points)
+
+    assert CountingSegments.scans == 1
+
+
+def test_underground_segments_are_classified_once_per_train(qtbot) -> None:
+    class CountingFormatter:
+        calls = 0
+
+        def is_underground_segment(self, segment):
+            CountingFormatter.calls += 1
+            return segment.line_name == "Tube"
+
+        def get_underground_system_info(self, segment):
+            return {"short_name": "Tube", "time_range": "5min", "emoji": "U"}
+
+    train = SimpleNamespace(route_segments=[_seg("X", "Y", "Rail"), _seg("Y", "Z", "Tube")])
+    service = StationFilterService(train, underground_formatter=CountingFormatter())
+    qtbot.addWidget(service)
+
+    def cp(name):
+        return SimpleNamespace(station_name=name, is_origin=False, is_destination=False)
+
+    result = service.filter_for_essential_stations_only(
+        [cp("Nowhere"), cp("London Waterloo East"), cp("Somewhere"), cp("London Victoria (Low Level)")]
+    )
+
+    indicator = "<font color='#DC241F'>U Use Tube (5min)</font>"
+    assert [p.station_name for p in result] == [
+        "London Waterloo East", indicator, "London Victoria (Low Level)", indicator
+    ]
+    assert CountingFormatter.calls == 2
+    # The immutable indicator row is built once and shared by every terminus
+    assert result[1] is result[3]
+
+
+def test_config_files_are_loaded_once_and_shared(qtbot) -> None:
+    first, second = StationFilterService(None), StationFilterService(None)
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    assert first.major_stations is second.major_stations
+    assert "London Waterloo" in first.major_stations
+    # Entries are interned, like ingested CallingPoint names
+    built = "".join(["London ", "Waterloo"])
+    assert next(name for name in first.major_stations if name == built) is sys.intern(built)
+    assert first.underground_system_indicators is second.underground_system_indicators
+
+
+def test_failed_config_read_is_retried_on_the_next_load(monkeypatch, tmp_path) -> None:
+    from src.ui.widgets.train_components import station_filter_service as module
+
+    data_dir = module._DATA_DIR
+    module._read_major_stations.cache_clear()
+    try:
+        monkeypatch.setattr(module, "_DATA_DIR", tmp_path)
+        assert module._load_major_stations() == frozenset()
+
+        monkeypatch.setattr(module, "_DATA_DIR", data_dir)
+        assert "London Waterloo" in module._load_major_stations()
+    finally:
+        module._read_major_stations.cache_clear()
+
+
+def test_destination_is_appended_without_scanning_the_list(qtbot) -> None:
+    class NoEquality(SimpleNamespace):
+        def __eq__(self, other):
+            raise AssertionError("essential filter compared calling points")
+
+        __hash__ = None
+
+    def cp(name, origin=False, destination=False):
+        return NoEquality(station_name=name, is_origin=origin, is_destination=destination)
+
+    service = StationFilterService(SimpleNamespace(route_segments=None))
+    qtbot.addWidget(service)
+    points = [cp("A", origin=True), cp("London Waterloo"), cp("Nowhere"), cp("B", destination=True)]
+
+    result = service.filter_for_essential_stations_only(points)
+
+    assert [p.station_name for p in result] == ["A", "London Waterloo", "B"]
+
+
+def test_essential_filter_walks_calling_points_once(qtbot) -> None:
+    class CountingPoints(list):
+        scans = 0
+
+        def __iter__(self):
+            CountingPoints.scans += 1
+            return super().__iter__()
+
+    def cp(name, origin=False, destination=False):
+        return SimpleNamespace(station_name=name, is_origin=origin, is_destination=destination)
+
+    service = StationFilterService(SimpleNamespace(route_segments=None))
+    qtbot.addWidget(service)
+    points = CountingPoints([cp("London Waterloo"), cp("B", destination=True), cp("A", origin=True)])
+
+    result = service.filter_for_essential_stations_only(points)
+
+    assert [p.station_name for p in result] == ["A", "London Waterloo", "B"]
+    assert CountingPoints.scans == 1
+
+
+def test_essential_filter_skips_per_station_name_sanitising(qtbot, monkeypatch) -> None:
+    def cp(name, origin=False, destination=False):
+        return SimpleNamespace(station_name=name, is_origin=origin, is_destination=destination)
+
+    service = StationFilterService(SimpleNamespace(route_segments=None))
+    qtbot.addWidget(service)
+    for public in ("is_major_station", "is_actual_user_journey_interchange"):
+        monkeypatch.setattr(service, public, _fail)
+    points = [cp("A", origin=True), cp(" London Waterloo "), cp("Nowhere"), cp("B", destination=True)]
+
+    result = service.filter_for_essential_stations_only(points)
+
+    assert [p.station_name.strip() for p in result] == ["A", "London Waterloo", "B"]
+
+
+def test_interchange_keys_are_sanitised_once_per_name(qtbot) -> None:
+    def cp(name, origin=False, destination=False):
+        return SimpleNamespace(station_name=name, is_origin=origin, is_destination=destination)
+
+    segments = [_seg("A", "B", "Line 1"), _seg("B", "C", "Line 2")]
+    for segment in segments:
+        segment.service_pattern = ""
+    service = StationFilterService(SimpleNamespace(route_segments=segments))
+    qtbot.addWidget(service)
+    points = [cp("A", origin=True), cp("B (Cross Country Line)"), cp("C", destination=True)]
+    key = StationFilterService._interchange_key
+    key.cache_clear()
+
+    first = service.filter_for_essential_stations_only(points)
+    second = service.filter_for_essential_stations_only(points)
+
+    assert first == second == points
+    assert (key.cache_info().misses, key.cache_info().hits) == (1, 1)
+
+
+def test_malformed_segment_pairs_are_skipped(qtbot) -> None:
+    train = SimpleNamespace(
+        route_segments=[
+            _seg("A", "B", "Line 1"),
+            SimpleNamespace(from_station="B", to_station="C"),  # no line_name
+            _seg("C", "D", "Line 3"),
+            _seg("D", "E", "Line 4"),
+        ]
+    )
+    service = StationFilterService(train)
+    qtbot.addWidget(service)
+
+    assert not service.is_actual_user_journey_interchange("B")
+    assert not service.is_actual_user_journey_interchange("C")
+    assert service.is_actual_user_journey_interchange("D")
+
+
+def test_underground_system_is_detected_from_the_leading_marker(qtbot) -> None:
+    service = StationFilterService(SimpleNamespace(route_segments=None))
+    qtbot.addWidget(service)
+
+    assert service.get_underground_system_for_station("<font color='#DC241F'>🚇 Use Tube (5min)</font>") == "Underground"
+    assert service.get_underground_system_for_station("London Waterloo") is None
+    assert service.get_underground_system_for_station("<font color='#f44336'>Walk</font>") is None
+
+
+def test_essential_filter_returns_empty_input_without_setup(qtbot, monkeypatch) -> None:
+    service = StationFilterService(SimpleNamespace(route_segments=[_seg("A", "B", "Tube")]))
+    qtbot.addWidget(service)
+    monkeypatch.setattr(service, "_underground_system_info", _fail)
+
+    points: list = []
+    assert service.filter_for_essential_stations_only(points) is points
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import datetime
+
+from src.models.train_data import CallingPoint, ServiceType, TrainData, TrainStatus
+
+
+def _cp(name):
+    return CallingPoint(
+        station_name=name,
+        scheduled_arrival=None,
+        scheduled_departure=None,
+        expected_arrival=None,
+        expected_departure=None,
+        platform=None,
+    )
+
+
+def test_calling_point_station_names_are_interned() -> None:
+    first = _cp("".join(["Clapham", " Junction"]))
+    second = _cp("".join(["Clapham ", "Junction"]))
+
+    assert first.station_name is second.station_name
+    assert replace(first, platform="1").station_name is first.station_name
+    assert _cp(None).station_name is None
+
+
+def test_arrival_time_is_formatted_once_per_train() -> None:
+    now = datetime(2026, 1, 1, 12, 34)
+    train = TrainData(
+        departure_time=now,
+        scheduled_departure=now,
+        destination="Destination",
+        platform=None,
+        operator="Operator",
+        service_type=ServiceType.FAST,
+        status=TrainStatus.ON_TIME,
+        delay_minutes=0,
+        estimated_arrival=now,
+        journey_duration=None,
+        current_location=None,
+        train_uid="uid",
+        service_id="service",
+        calling_points=[],
+    )
+
+    assert train.format_arrival_time() == "12:34"
+    assert train.formatted_arrival_time is train.format_arrival_time()
+    assert replace(train, estimated_arrival=None).format_arrival_time() == "Unknown"
+    assert train == replace(train)  # the cache is not part of equality
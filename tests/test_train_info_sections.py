@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import sys
+from dataclasses import replace
+from datetime import datetime
+
+from src.models.train_data import ServiceType, TrainData, TrainStatus
+from src.ui.widgets.train_components import TrainDetailsSection, TrainMainInfoSection
+
+
+def _train() -> TrainData:
+    now = datetime(2026, 1, 1, 12, 0, 0)
+    return TrainData(
+        departure_time=now,
+        scheduled_departure=now,
+        destination="Destination",
+        platform="1",
+        operator="Operator",
+        service_type=ServiceType.FAST,
+        status=TrainStatus.ON_TIME,
+        delay_minutes=0,
+        estimated_arrival=now,
+        journey_duration=None,
+        current_location=None,
+        train_uid="uid",
+        service_id="service",
+        calling_points=[],
+    )
+
+
+def test_details_section_only_sets_changed_label_texts(qtbot, monkeypatch) -> None:
+    train = _train()
+    section = TrainDetailsSection(train, theme="dark")
+    qtbot.addWidget(section)
+    assert section.operator_info.text() == "Operator"
+
+    operator_texts: list[str] = []
+    monkeypatch.setattr(section.operator_info, "setText", operator_texts.append)
+
+    section.set_train_data(replace(train, status=TrainStatus.DELAYED, delay_minutes=5))
+    assert section.status_info.property("trainStatus") == TrainStatus.DELAYED.value
+    assert operator_texts == []
+
+    section.set_train_data(replace(train, operator="Other"))
+    assert operator_texts == ["Other"]
+
+
+def test_main_info_section_only_sets_changed_label_texts(qtbot, monkeypatch) -> None:
+    train = _train()
+    section = TrainMainInfoSection(train, theme="dark")
+    qtbot.addWidget(section)
+    assert section.destination_info.text() == "→ Destination"
+
+    destination_texts: list[str] = []
+    monkeypatch.setattr(section.destination_info, "setText", destination_texts.append)
+
+    section.set_train_data(replace(train, platform="2"))
+    assert section.platform_info.text() == "Platform 2"
+    assert destination_texts == []
+
+
+def test_sections_share_fonts_across_rows(qtbot) -> None:
+    first = TrainMainInfoSection(_train(), theme="dark")
+    second = TrainDetailsSection(_train(), theme="light")
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    assert first.get_font(20, bold=True) is second.get_font(20, bold=True)
+    assert first.details_button.font() == second.status_info.font()
+    assert second.status_info.font().bold() and second.status_info.font().pointSize() == 20
+
+
+def test_row_sections_share_one_stylesheet_per_theme(qtbot) -> None:
+    main = TrainMainInfoSection(_train(), theme="light")
+    details = TrainDetailsSection(_train(), theme="light")
+    other = TrainDetailsSection(_train(), theme="light")
+    for widget in (main, details, other):
+        qtbot.addWidget(widget)
+
+    assert details.styleSheet().startswith(main.styleSheet())
+    assert details.styleSheet() == other.styleSheet()
+    assert main.get_label_stylesheet() is other.get_label_stylesheet()
+
+    details.apply_theme("dark")
+    assert "color: #ffffff" in details.styleSheet()
+    assert details.styleSheet() != other.styleSheet()
+
+
+def test_route_button_click_follows_the_layout(qtbot) -> None:
+    from PySide6.QtCore import Qt
+
+    section = TrainMainInfoSection(_train(), theme="dark")
+    qtbot.addWidget(section)
+    section.resize(600, 60)
+    section.show()
+    qtbot.waitExposed(section)
+
+    section.resize(900, 60)
+    qtbot.waitUntil(lambda: section.details_button.geometry().right() > 600)
+
+    with qtbot.waitSignal(section.route_clicked):
+        qtbot.mouseClick(section.details_button, Qt.MouseButton.LeftButton)
+    with qtbot.assertNotEmitted(section.route_clicked):
+        qtbot.mouseClick(section.time_info, Qt.MouseButton.LeftButton)
+
+
+def test_train_items_build_each_row_stylesheet_once(qtbot, monkeypatch) -> None:
+    from src.ui.widgets.train_item_widget import TrainItemWidget
+
+    monkeypatch.setattr(TrainItemWidget, "_STYLE_CACHE", {})
+    built: list[str] = []
+    original = TrainItemWidget._build_stylesheet
+
+    def counting(self, status_color):
+        built.append(status_color)
+        return original(self, status_color)
+
+    monkeypatch.setattr(TrainItemWidget, "_build_stylesheet", counting)
+
+    items = [TrainItemWidget(_train(), theme="dark") for _ in range(3)]
+    items.append(TrainItemWidget(replace(_train(), status=TrainStatus.DELAYED, delay_minutes=5), theme="dark"))
+    for item in items:
+        qtbot.addWidget(item)
+
+    assert len(built) == 2  # one per distinct status colour
+    assert items[0].styleSheet() == items[1].styleSheet() != items[3].styleSheet()
+
+    items[0].update_theme("light")
+    assert len(built) == 3
+    assert "#ffffff !important" in items[0].styleSheet()
+
+
+def test_theme_palettes_and_scroll_stylesheets_are_shared() -> None:
+    from src.ui.widgets.train_list_theme import scroll_area_stylesheet
+    from src.ui.widgets.train_theme_colors import theme_colors
+
+    assert theme_colors("dark") is theme_colors("dark")
+    assert theme_colors("light")["text_primary"] == "#000000"
+    assert scroll_area_stylesheet("dark") is scroll_area_stylesheet("dark")
+    assert theme_colors("dark")["border_primary"] in scroll_area_stylesheet("dark")
+
+
+def test_route_click_is_forwarded_through_a_declared_slot(qtbot) -> None:
+    from src.ui.widgets.train_item_widget import TrainItemWidget
+
+    item = TrainItemWidget(_train(), theme="dark")
+    qtbot.addWidget(item)
+    # Declared on the class, not appended to the meta-object at connect time
+    meta = TrainItemWidget.staticMetaObject
+
+    slots = {
+        bytes(meta.method(i).methodSignature()).split(b"(")[0]
+        for i in range(meta.methodOffset(), meta.methodCount())
+    }
+    assert b"_on_route_clicked" in slots
+    with qtbot.waitSignal(item.route_clicked) as blocker:
+        item.main_info_section.route_clicked.emit(item.train_data)
+    assert blocker.args == [item.train_data]
+
+
+def test_train_items_share_one_interned_theme_string(qtbot) -> None:
+    from src.ui.widgets.train_item_widget import TrainItemWidget
+
+    # Theme names read from config are fresh strings, not the literal
+    runtime_theme = "".join(["da", "rk"])
+    items = [TrainItemWidget(_train(), theme="".join(["da", "rk"])) for _ in range(2)]
+    for item in items:
+        qtbot.addWidget(item)
+
+    interned = sys.intern("dark")
+    assert runtime_theme is not interned
+    assert items[0].current_theme is items[1].current_theme is interned
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from src.managers.services.route_calc_components.route_objects import MinimalSegment
+from src.ui.formatters.underground_formatter import UndergroundFormatter
+from src.ui.formatters.underground_segment_cache import CachedUndergroundLookup
+
+
+class _CountingFormatter(UndergroundFormatter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def is_underground_segment(self, segment) -> bool:
+        self.calls += 1
+        return super().is_underground_segment(segment)
+
+
+def test_cached_underground_lookup_classifies_each_segment_once() -> None:
+    formatter = _CountingFormatter()
+    lookup = CachedUndergroundLookup(formatter)
+    segment = MinimalSegment(from_station="A", to_station="B", is_walking=False)
+
+    assert lookup.is_underground_segment(segment) is False
+    assert lookup.get_underground_system_info(segment) == {}
+    assert lookup.is_underground_segment(segment) is False
+    assert formatter.calls == 1
+
+    lookup.clear()
+    lookup.is_underground_segment(segment)
+    assert formatter.calls == 2
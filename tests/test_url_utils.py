@@ -33,3 +33,59 @@ def test_canonicalize_url_treats_root_paths_equally():
         "https://example.com/"
     )
 
+
+def test_canonicalize_url_fast_query_path_matches_parse_qsl_round_trip():
+    from urllib.parse import parse_qsl, urlencode
+
+    from src.utils.url_utils import _TRACKING_QUERY_KEYS
+
+    queries = [
+        "",
+        "b=2&a=1",
+        "B=1&a=2&a=1",
+        "flag&&x=&=v",
+        "a=b=c",
+        "q=hello+world",
+        "q=a%20b&utm_source=x",
+        "u=http://x.org/p",
+        "k=café",
+        "a=1;b=2",
+    ]
+    for q in queries:
+        pairs = [
+            (k, v)
+            for k, v in parse_qsl(q, keep_blank_values=True)
+            if k.lower() not in _TRACKING_QUERY_KEYS
+        ]
+        pairs.sort(key=lambda kv: (kv[0].lower(), kv[1]))
+        expected = "https://example.com/x" + (f"?{urlencode(pairs)}" if pairs else "")
+        assert canonicalize_url(f"https://example.com/x?{q}") == expected, q
+
+
+def test_canonicalize_url_memoises_repeat_urls():
+    canonicalize_url.cache_clear()
+    urls = ["https://example.com/x/", "https://example.com/x/", "https://example.com/y"]
+
+    dedupe_urls(urls)
+
+    info = canonicalize_url.cache_info()
+    assert (info.hits, info.misses) == (1, 2)
+
+
+def test_dedupe_urls_drops_repeats_of_the_same_string_object():
+    url = "https://example.com/x"
+    assert dedupe_urls([url, url, "", "https://example.com/x/"]) == [url]
+
+
+def test_first_unique_url_skips_used_and_records_choice():
+    from src.utils.url_utils import first_unique_url
+
+    used = {canonicalize_url("https://example.com/a")}
+    assert first_unique_url(["https://www.example.com/a/", "https://example.com/b"], used) == "https://example.com/b"
+    assert used == {"https://example.com/a", "https://example.com/b"}
+    assert first_unique_url(["https://example.com/b#top"], used) is None
+
+
+def test_canonicalize_url_keeps_input_order_for_keys_differing_only_in_case():
+    assert canonicalize_url("https://example.com/x?b=1&a=2&A=2&UTM_Source=z") == "https://example.com/x?a=2&A=2&b=1"
+    assert canonicalize_url("https://example.com/y?A=2&a=2") == "https://example.com/y?A=2&a=2"